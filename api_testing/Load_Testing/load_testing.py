@@ -11,33 +11,63 @@ import argparse
 import asyncio
 import csv
 import datetime
+import gzip
+import io
 import json
 import logging
+import math
 import os
 import platform
+import queue
 import random
-import statistics
+import re
+import socket
 import sys
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import warnings
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urlparse
 
 import aiohttp
 import matplotlib.pyplot as plt
 import numpy as np
 import psutil
-import requests
+from aiohttp.abc import AbstractResolver
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize an object to JSON bytes."""
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+except ImportError:  # pragma: no cover - optional speedup
+    _loads = json.loads
+    
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -57,6 +87,17 @@ DEFAULT_USER_AGENT = (
     f"(Python/{platform.python_version()}; "
     f"{platform.system()}/{platform.release()})"
 )
+REQUEST_STATS_FILE = "request_stats.jsonl.gz"
+REQUEST_STATS_COLUMNS = (
+    "request_id", "status_code", "response_time", "response_size",
+    "timestamp", "success", "error"
+)
+HISTOGRAM_MIN_MS = 0.001  # smallest distinguishable response time
+HISTOGRAM_PRECISION = 0.001  # relative width of a histogram bucket
+STATS_WRITE_BUFFER = 1 << 20  # bytes
+RESPONSE_CHUNK_SIZE = 64 * 1024  # bytes
+HEADER_PATTERN = re.compile(r"^([^:]+):\s*(.*)$")
+PARAM_PATTERN = re.compile(r"^([^=]+)=(.*)$")
 
 
 class HttpMethod(Enum):
@@ -98,6 +139,63 @@ class RequestStats:
     error: Optional[str] = None
 
 
+@dataclass
+class ResponseTimeStats:
+    """Running aggregates over response times, kept in constant memory.
+    
+    Percentiles are read from a log-bucketed histogram, so they are exact
+    to within HISTOGRAM_PRECISION (relative) without storing every sample.
+    """
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = 0.0
+    buckets: Counter = field(default_factory=Counter)
+    
+    def add(self, value: float) -> None:
+        """Fold one response time (in milliseconds) into the aggregates."""
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        self.buckets[self._bucket(value)] += 1
+    
+    @staticmethod
+    def _bucket(value: float) -> int:
+        """Histogram bucket holding a response time."""
+        return int(math.log(max(value, HISTOGRAM_MIN_MS) / HISTOGRAM_MIN_MS)
+                   / math.log1p(HISTOGRAM_PRECISION))
+    
+    def _value(self, bucket: int) -> float:
+        """Representative response time of a bucket, within the observed range."""
+        value = HISTOGRAM_MIN_MS * math.exp((bucket + 0.5) * math.log1p(HISTOGRAM_PRECISION))
+        return min(max(value, self.minimum), self.maximum)
+    
+    @property
+    def mean(self) -> float:
+        """Mean response time, or 0.0 when nothing was recorded."""
+        return self.total / self.count if self.count else 0.0
+    
+    def percentile(self, fraction: float) -> float:
+        """Response time below which the given fraction of samples fall."""
+        if not self.count:
+            return 0.0
+        rank = int(self.count * fraction)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen > rank:
+                return self._value(bucket)
+        return self.maximum
+    
+    def histogram(self) -> Tuple[List[float], List[int]]:
+        """Bucket response times and their sample counts, for plotting."""
+        buckets = sorted(self.buckets)
+        return [self._value(b) for b in buckets], [self.buckets[b] for b in buckets]
+
+
 @dataclass
 class TestResult:
     """Overall results from a load test."""
@@ -107,7 +205,12 @@ class TestResult:
     successful_requests: int
     failed_requests: int
     total_bytes_received: int
-    request_stats: List[RequestStats] = field(default_factory=list)
+    # Aggregated from the request stats stream; only successful requests
+    # count towards the response times
+    response_times: ResponseTimeStats = field(default_factory=ResponseTimeStats)
+    requests_by_second: Counter = field(default_factory=Counter)
+    successes_by_second: Counter = field(default_factory=Counter)
+    response_time_by_second: Counter = field(default_factory=Counter)
     
     @property
     def duration(self) -> float:
@@ -131,79 +234,37 @@ class TestResult:
     @property
     def average_response_time(self) -> float:
         """Average response time in milliseconds."""
-        if not self.request_stats:
-            return 0.0
-        return statistics.mean(
-            stat.response_time for stat in self.request_stats if stat.success
-        )
+        return self.response_times.mean
     
     @property
     def median_response_time(self) -> float:
         """Median response time in milliseconds."""
-        if not self.request_stats:
-            return 0.0
-        return statistics.median(
-            stat.response_time for stat in self.request_stats if stat.success
-        )
+        return self.response_times.percentile(0.5)
     
     @property
     def min_response_time(self) -> float:
         """Minimum response time in milliseconds."""
-        if not self.request_stats:
-            return 0.0
-        return min(
-            (stat.response_time for stat in self.request_stats if stat.success),
-            default=0.0
-        )
+        return self.response_times.minimum if self.response_times.count else 0.0
     
     @property
     def max_response_time(self) -> float:
         """Maximum response time in milliseconds."""
-        if not self.request_stats:
-            return 0.0
-        return max(
-            (stat.response_time for stat in self.request_stats if stat.success),
-            default=0.0
-        )
+        return self.response_times.maximum
     
     @property
     def p90_response_time(self) -> float:
         """90th percentile response time in milliseconds."""
-        if not self.request_stats:
-            return 0.0
-        response_times = sorted(
-            stat.response_time for stat in self.request_stats if stat.success
-        )
-        if not response_times:
-            return 0.0
-        index = int(len(response_times) * 0.9)
-        return response_times[index]
+        return self.response_times.percentile(0.9)
     
     @property
     def p95_response_time(self) -> float:
         """95th percentile response time in milliseconds."""
-        if not self.request_stats:
-            return 0.0
-        response_times = sorted(
-            stat.response_time for stat in self.request_stats if stat.success
-        )
-        if not response_times:
-            return 0.0
-        index = int(len(response_times) * 0.95)
-        return response_times[index]
+        return self.response_times.percentile(0.95)
     
     @property
     def p99_response_time(self) -> float:
         """99th percentile response time in milliseconds."""
-        if not self.request_stats:
-            return 0.0
-        response_times = sorted(
-            stat.response_time for stat in self.request_stats if stat.success
-        )
-        if not response_times:
-            return 0.0
-        index = int(len(response_times) * 0.99)
-        return response_times[index]
+        return self.response_times.percentile(0.99)
     
     @property
     def throughput_bytes_per_second(self) -> float:
@@ -225,7 +286,6 @@ class LoadTestConfig:
     think_time_min: float = 0.0  # seconds
     think_time_max: float = 0.0  # seconds
     request_timeout: int = DEFAULT_TIMEOUT
-    use_async: bool = True
     max_retries: int = 0
     retry_delay: float = 1.0  # seconds
     output_dir: str = "results"
@@ -233,6 +293,28 @@ class LoadTestConfig:
     verbose: bool = False
 
 
+class PinnedResolver(AbstractResolver):
+    """DNS resolver that resolves each host once and reuses the answer."""
+    
+    def __init__(self) -> None:
+        self._resolver = aiohttp.DefaultResolver()
+        self._cache: Dict[Tuple[str, int, int], List[Dict[str, Any]]] = {}
+    
+    async def resolve(self, host: str, port: int = 0,
+                      family: int = socket.AF_INET) -> List[Dict[str, Any]]:
+        """Return the cached addresses for a host, resolving it on first use."""
+        key = (host, port, family)
+        addresses = self._cache.get(key)
+        if addresses is None:
+            addresses = await self._resolver.resolve(host, port, family)
+            self._cache[key] = addresses
+        return addresses
+    
+    async def close(self) -> None:
+        """Close the underlying resolver."""
+        await self._resolver.close()
+
+
 class LoadTester:
     """Main load testing class that orchestrates the test execution."""
 
@@ -249,8 +331,12 @@ class LoadTester:
             total_bytes_received=0,
         )
         self.system_metrics = []
-        self.stop_event = asyncio.Event() if config.use_async else None
+        self.stop_event: Optional[asyncio.Event] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._stats_q: Optional[queue.SimpleQueue] = None
+        self._stats_writer: Optional[threading.Thread] = None
         self._create_output_dir()
+        self.stats_file = self.test_dir / REQUEST_STATS_FILE
         
     def _create_output_dir(self) -> None:
         """Create the output directory for test results if it doesn't exist."""
@@ -282,23 +368,67 @@ class LoadTester:
             
             time.sleep(1)
     
+    def _write_stats(self, stats_q: queue.SimpleQueue, path: Path) -> None:
+        """
+        Drain queued request stats into a gzip-compressed JSON-lines file.
+        
+        The first line names the columns. Each stat is folded into the
+        result's running aggregates as it passes, so reporting never has to
+        read the file back.
+        """
+        results = self.results
+        response_times = results.response_times
+        requests_by_second = results.requests_by_second
+        successes_by_second = results.successes_by_second
+        response_time_by_second = results.response_time_by_second
+        start_time = results.start_time
+        
+        with gzip.open(path, "wb") as f, io.BufferedWriter(f, STATS_WRITE_BUFFER) as buf:
+            buf.write(_dumps(REQUEST_STATS_COLUMNS))
+            buf.write(b"\n")
+            while True:
+                item = stats_q.get()
+                if item is None:
+                    break
+                buf.write(_dumps(item))
+                buf.write(b"\n")
+                
+                _, _, response_time, _, timestamp, success, _ = item
+                second = int(timestamp - start_time)
+                requests_by_second[second] += 1
+                if success:
+                    response_times.add(response_time)
+                    successes_by_second[second] += 1
+                    response_time_by_second[second] += response_time
+    
+    def _start_stats_writer(self) -> None:
+        """Start the background thread that streams request stats to disk."""
+        self._stats_q = queue.SimpleQueue()
+        self._stats_writer = threading.Thread(
+            target=self._write_stats,
+            args=(self._stats_q, self.stats_file),
+            daemon=True
+        )
+        self._stats_writer.start()
+    
+    def _stop_stats_writer(self) -> None:
+        """Flush pending request stats and wait for the writer to finish."""
+        if self._stats_writer is None:
+            return
+        self._stats_q.put(None)
+        self._stats_writer.join()
+        self._stats_writer = None
+    
+    def _record(self, stat: RequestStats) -> None:
+        """Queue a request's stats for the background writer."""
+        self._stats_q.put((
+            stat.request_id, stat.status_code, stat.response_time,
+            stat.response_size, stat.timestamp, stat.success, stat.error
+        ))
+    
     def _save_metrics(self) -> None:
         """Save collected metrics to disk."""
-        # Save request stats as CSV
-        requests_file = self.test_dir / "request_stats.csv"
-        with open(requests_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "request_id", "url", "method", "status_code", 
-                "response_time", "response_size", "timestamp", 
-                "success", "error"
-            ])
-            for stat in self.results.request_stats:
-                writer.writerow([
-                    stat.request_id, stat.url, stat.method, stat.status_code,
-                    stat.response_time, stat.response_size, stat.timestamp,
-                    stat.success, stat.error or ""
-                ])
+        # Per-request stats are already on disk in self.stats_file
         
         # Save system metrics as CSV
         if self.system_metrics:
@@ -346,12 +476,12 @@ class LoadTester:
                 "p99": self.results.p99_response_time,
             }
         }
-        with open(summary_file, "w") as f:
-            json.dump(summary, f, indent=2)
+        with open(summary_file, "wb") as f:
+            f.write(_dumps(summary, indent=True))
     
     def _generate_report(self) -> None:
         """Generate visual reports of the test results."""
-        if not self.results.request_stats:
+        if not self.results.total_requests:
             logger.warning("No request stats available for generating reports")
             return
         
@@ -361,11 +491,9 @@ class LoadTester:
         
         # 1. Response time distribution
         plt.figure(figsize=(10, 6))
-        response_times = [
-            stat.response_time for stat in self.results.request_stats if stat.success
-        ]
+        response_times, counts = self.results.response_times.histogram()
         if response_times:
-            plt.hist(response_times, bins=50, alpha=0.75)
+            plt.hist(response_times, bins=50, weights=counts, alpha=0.75)
             plt.axvline(
                 x=self.results.average_response_time,
                 color='r',
@@ -392,17 +520,16 @@ class LoadTester:
             plt.savefig(plots_dir / "response_time_distribution.png")
             plt.close()
         
-        # 2. Response time over time
+        # 2. Response time over time, averaged per second
         plt.figure(figsize=(10, 6))
-        timestamps = [
-            stat.timestamp - self.results.start_time 
-            for stat in self.results.request_stats if stat.success
-        ]
+        successes_by_second = self.results.successes_by_second
+        response_time_by_second = self.results.response_time_by_second
+        timestamps = sorted(successes_by_second)
         response_times = [
-            stat.response_time 
-            for stat in self.results.request_stats if stat.success
+            response_time_by_second[second] / successes_by_second[second]
+            for second in timestamps
         ]
-        if timestamps and response_times:
+        if len(timestamps) > 1:
             plt.scatter(timestamps, response_times, alpha=0.5, s=10)
             # Add trend line
             z = np.polyfit(timestamps, response_times, 1)
@@ -428,13 +555,9 @@ class LoadTester:
         duration = int(end_time - start_time) + 1
         requests_per_second = [0] * duration
         
-        for stat in self.results.request_stats:
-            second = min(
-                int(stat.timestamp - start_time),
-                duration - 1
-            )
+        for second, count in self.results.requests_by_second.items():
             if second >= 0:
-                requests_per_second[second] += 1
+                requests_per_second[min(second, duration - 1)] += count
         
         plt.bar(range(duration), requests_per_second, alpha=0.7)
         plt.axhline(
@@ -549,110 +672,45 @@ class LoadTester:
         error_msg = None
         
         try:
-            timeout = aiohttp.ClientTimeout(total=req_config.timeout)
+            request_method = getattr(self._session, method.lower())
             
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                request_method = getattr(session, method.lower())
-                
-                async with request_method(
-                    url,
-                    headers=headers,
-                    params=req_config.params,
-                    json=req_config.json_data,
-                    data=req_config.data,
-                    ssl=req_config.verify_ssl,
-                    auth=req_config.auth
-                ) as response:
-                    # Read the response body
-                    body = await response.read()
-                    response_size = len(body)
-                    
-                    # Calculate response time
-                    end_time = time.time()
-                    response_time_ms = (end_time - start_time) * 1000
-                    
-                    status_code = response.status
-                    success = 200 <= status_code < 400
-                    
-                    # Optionally save response
-                    if self.config.save_responses:
-                        response_dir = self.test_dir / "responses"
-                        response_dir.mkdir(exist_ok=True)
-                        
-                        with open(response_dir / f"{request_id}.txt", "wb") as f:
-                            f.write(f"Status: {status_code}\n\n".encode())
-                            f.write(body)
-        
-        except asyncio.TimeoutError:
-            error_msg = "Request timed out"
-            end_time = time.time()
-            response_time_ms = (end_time - start_time) * 1000
-        
-        except Exception as e:
-            error_msg = str(e)
-            end_time = time.time()
-            response_time_ms = (end_time - start_time) * 1000
-        
-        return RequestStats(
-            request_id=request_id,
-            url=url,
-            method=method,
-            status_code=status_code,
-            response_time=response_time_ms,
-            response_size=response_size,
-            timestamp=start_time,
-            success=success,
-            error=error_msg
-        )
-    
-    def _send_request(self, user_id: int, request_id: str) -> RequestStats:
-        """Send a single HTTP request."""
-        req_config = self.config.request_config
-        url = req_config.url
-        method = req_config.method.value
-        
-        headers = {
-            "User-Agent": DEFAULT_USER_AGENT,
-            **req_config.headers
-        }
-        
-        start_time = time.time()
-        success = False
-        status_code = 0
-        response_time_ms = 0
-        response_size = 0
-        error_msg = None
-        
-        try:
-            response = requests.request(
-                method=method,
-                url=url,
+            async with request_method(
+                url,
                 headers=headers,
                 params=req_config.params,
                 json=req_config.json_data,
                 data=req_config.data,
-                timeout=req_config.timeout,
-                verify=req_config.verify_ssl,
+                ssl=req_config.verify_ssl,
                 auth=req_config.auth
-            )
-            
-            end_time = time.time()
-            response_time_ms = (end_time - start_time) * 1000
-            
-            status_code = response.status_code
-            response_size = len(response.content)
-            success = 200 <= status_code < 400
-            
-            # Optionally save response
-            if self.config.save_responses:
-                response_dir = self.test_dir / "responses"
-                response_dir.mkdir(exist_ok=True)
+            ) as response:
+                # Only buffer the body when it has to be saved; otherwise
+                # stream it through and just count the bytes
+                if self.config.save_responses:
+                    body = await response.read()
+                    response_size = len(body)
+                else:
+                    async for chunk in response.content.iter_chunked(
+                        RESPONSE_CHUNK_SIZE
+                    ):
+                        response_size += len(chunk)
+                
+                # Calculate response time
+                end_time = time.time()
+                response_time_ms = (end_time - start_time) * 1000
+                
+                status_code = response.status
+                success = 200 <= status_code < 400
                 
-                with open(response_dir / f"{request_id}.txt", "wb") as f:
-                    f.write(f"Status: {status_code}\n\n".encode())
-                    f.write(response.content)
+                # Optionally save response
+                if self.config.save_responses:
+                    response_dir = self.test_dir / "responses"
+                    response_dir.mkdir(exist_ok=True)
+                    
+                    with open(response_dir / f"{request_id}.txt", "wb") as f:
+                        f.write(f"Status: {status_code}\n\n".encode())
+                        f.write(body)
         
-        except requests.Timeout:
+        except asyncio.TimeoutError:
             error_msg = "Request timed out"
             end_time = time.time()
             response_time_ms = (end_time - start_time) * 1000
@@ -674,152 +732,97 @@ class LoadTester:
             error=error_msg
         )
     
-    async def _user_async(self, user_id: int, progress: Optional[Progress] = None,
-                         task_id: Optional[int] = None) -> None:
-        """Simulate a single user's behavior asynchronously."""
-        # Calculate delay for ramp-up
-        if self.config.ramp_up_time > 0:
-            delay = (user_id / self.config.concurrent_users) * self.config.ramp_up_time
-            await asyncio.sleep(delay)
-        
-        request_count = 0
-        end_time = self.results.start_time + self.config.test_duration
+    def _make_user_loop_async(self) -> Callable[..., Any]:
+        """Build the async per-user loop with the test config bound as locals."""
+        config = self.config
+        results = self.results
+        record = self._record
+        send = self._send_request_async
+        stop_event = self.stop_event
+        concurrent_users = config.concurrent_users
+        ramp_up_time = config.ramp_up_time
+        requests_per_user = config.requests_per_user
+        think_time_min = config.think_time_min
+        think_time_max = config.think_time_max
+        max_retries = config.max_retries
+        retry_delay = config.retry_delay
+        verbose = config.verbose
+        end_time = results.start_time + config.test_duration
+        now = time.time
+        sleep = asyncio.sleep
+        uniform = random.uniform
         
-        while time.time() < end_time and not self.stop_event.is_set():
-            # Check if we've reached the request limit
-            if (self.config.requests_per_user is not None and 
-                request_count >= self.config.requests_per_user):
-                break
+        async def loop(user_id: int, progress: Optional[Progress] = None,
+                       task_id: Optional[int] = None) -> None:
+            # Calculate delay for ramp-up
+            if ramp_up_time > 0:
+                await sleep((user_id / concurrent_users) * ramp_up_time)
             
-            # Generate unique request ID
-            request_id = f"user_{user_id}_req_{request_count}_{int(time.time())}"
+            request_count = 0
             
-            # Send request
-            request_stats = await self._send_request_async(user_id, request_id)
-            
-            # Process results
-            self.results.request_stats.append(request_stats)
-            self.results.total_requests += 1
-            
-            if request_stats.success:
-                self.results.successful_requests += 1
-                self.results.total_bytes_received += request_stats.response_size
-            else:
-                self.results.failed_requests += 1
+            while now() < end_time and not stop_event.is_set():
+                # Check if we've reached the request limit
+                if requests_per_user is not None and request_count >= requests_per_user:
+                    break
+                
+                # Generate unique request ID
+                request_id = f"user_{user_id}_req_{request_count}_{int(now())}"
+                
+                # Send request
+                request_stats = await send(user_id, request_id)
+                
+                # Process results
+                record(request_stats)
+                ok = request_stats.success
+                results.total_requests += 1
+                results.successful_requests += ok
+                results.failed_requests += 1 - ok
+                results.total_bytes_received += ok * request_stats.response_size
                 
                 # Retry failed requests if configured
                 retries = 0
                 while (not request_stats.success and 
-                       retries < self.config.max_retries and 
-                       time.time() < end_time and 
-                       not self.stop_event.is_set()):
-                    await asyncio.sleep(self.config.retry_delay)
+                       retries < max_retries and 
+                       now() < end_time and 
+                       not stop_event.is_set()):
+                    await sleep(retry_delay)
                     
-                    if self.config.verbose:
+                    if verbose:
                         logger.info(
                             f"Retrying failed request: {request_id}, "
-                            f"attempt {retries+1}/{self.config.max_retries}"
+                            f"attempt {retries+1}/{max_retries}"
                         )
                     
-                    request_stats = await self._send_request_async(
+                    request_stats = await send(
                         user_id, f"{request_id}_retry_{retries}"
                     )
                     
                     # Process retry results
-                    self.results.request_stats.append(request_stats)
-                    self.results.total_requests += 1
-                    
-                    if request_stats.success:
-                        self.results.successful_requests += 1
-                        self.results.total_bytes_received += request_stats.response_size
-                    else:
-                        self.results.failed_requests += 1
+                    record(request_stats)
+                    ok = request_stats.success
+                    results.total_requests += 1
+                    results.successful_requests += ok
+                    results.failed_requests += 1 - ok
+                    results.total_bytes_received += ok * request_stats.response_size
                     
                     retries += 1
-            
-            # Update progress
-            if progress and task_id is not None:
-                progress.update(task_id, advance=1)
-            
-            request_count += 1
-            
-            # Simulate think time
-            if self.config.think_time_max > 0:
-                think_time = random.uniform(
-                    self.config.think_time_min, self.config.think_time_max
-                )
-                await asyncio.sleep(think_time)
-    
-    def _user(self, user_id: int) -> None:
-        """Simulate a single user's behavior."""
-        # Calculate delay for ramp-up
-        if self.config.ramp_up_time > 0:
-            delay = (user_id / self.config.concurrent_users) * self.config.ramp_up_time
-            time.sleep(delay)
-        
-        request_count = 0
-        end_time = self.results.start_time + self.config.test_duration
-        
-        while time.time() < end_time:
-            # Check if we've reached the request limit
-            if (self.config.requests_per_user is not None and 
-                request_count >= self.config.requests_per_user):
-                break
-            
-            # Generate unique request ID
-            request_id = f"user_{user_id}_req_{request_count}_{int(time.time())}"
-            
-            # Send request
-            request_stats = self._send_request(user_id, request_id)
-            
-            # Process results (thread-safe operation)
-            with self._results_lock:
-                self.results.request_stats.append(request_stats)
-                self.results.total_requests += 1
                 
-                if request_stats.success:
-                    self.results.successful_requests += 1
-                    self.results.total_bytes_received += request_stats.response_size
-                else:
-                    self.results.failed_requests += 1
-                    
-                    # Retry failed requests if configured
-                    retries = 0
-                    while (not request_stats.success and 
-                          retries < self.config.max_retries and 
-                          time.time() < end_time):
-                        time.sleep(self.config.retry_delay)
-                        
-                        if self.config.verbose:
-                            logger.info(
-                                f"Retrying failed request: {request_id}, "
-                                f"attempt {retries+1}/{self.config.max_retries}"
-                            )
-                        
-                        request_stats = self._send_request(
-                            user_id, f"{request_id}_retry_{retries}"
-                        )
-                        
-                        # Process retry results
-                        self.results.request_stats.append(request_stats)
-                        self.results.total_requests += 1
-                        
-                        if request_stats.success:
-                            self.results.successful_requests += 1
-                            self.results.total_bytes_received += request_stats.response_size
-                        else:
-                            self.results.failed_requests += 1
-                        
-                        retries += 1
-            
-            request_count += 1
-            
-            # Simulate think time
-            if self.config.think_time_max > 0:
-                think_time = random.uniform(
-                    self.config.think_time_min, self.config.think_time_max
-                )
-                time.sleep(think_time)
+                # Update progress
+                if progress and task_id is not None:
+                    progress.update(task_id, advance=1)
+                
+                request_count += 1
+                
+                # Simulate think time
+                if think_time_max > 0:
+                    await sleep(uniform(think_time_min, think_time_max))
+        
+        return loop
+    
+    async def _user_async(self, user_id: int, progress: Optional[Progress] = None,
+                         task_id: Optional[int] = None) -> None:
+        """Simulate a single user's behavior asynchronously."""
+        await self._user_async_impl(user_id, progress, task_id)
     
     async def _run_async(self) -> None:
         """Run the load test using asyncio."""
@@ -835,13 +838,35 @@ class LoadTester:
         self.results.start_time = time.time()
         self.results.end_time = self.results.start_time + self.config.test_duration
         self.stop_event = asyncio.Event()
+        self._start_stats_writer()
+        self._user_async_impl = self._make_user_loop_async()
         
         # Start system metrics collection in a separate thread
-        import threading
         metrics_thread = threading.Thread(target=self._collect_system_metrics)
         metrics_thread.daemon = True
         metrics_thread.start()
         
+        # Resolve the target once so steady-state requests skip DNS lookups
+        resolver = PinnedResolver()
+        target = urlparse(self.config.request_config.url)
+        try:
+            await resolver.resolve(
+                target.hostname,
+                target.port or (443 if target.scheme == "https" else 80),
+                socket.AF_UNSPEC
+            )
+        except OSError as e:
+            logger.warning(f"Could not pre-resolve {target.hostname}: {e}")
+        
+        # Share one session and connection pool across all simulated users
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                resolver=resolver,
+                limit=self.config.concurrent_users
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.config.request_config.timeout)
+        )
+        
         # Setup progress tracking
         progress = Progress(
             SpinnerColumn(),
@@ -882,65 +907,12 @@ class LoadTester:
             finally:
                 # Ensure end time is set
                 self.results.end_time = time.time()
+                await self._session.close()
         
         # Wait for metrics thread to finish
         metrics_thread.join(timeout=2.0)
         
-        self._save_metrics()
-        self._generate_report()
-        self._print_summary()
-        
-        self.console.print(
-            f"[bold green]Test completed. Results saved to: {self.test_dir}[/bold green]"
-        )
-    
-    def _run_threaded(self) -> None:
-        """Run the load test using threads."""
-        self.console.print(
-            f"[bold]Starting load test: {self.config.name}[/bold]"
-        )
-        self.console.print(
-            f"Target URL: {self.config.request_config.url}\n"
-            f"Concurrent Users: {self.config.concurrent_users}\n"
-            f"Test Duration: {self.config.test_duration} seconds"
-        )
-        
-        self.results.start_time = time.time()
-        self.results.end_time = self.results.start_time + self.config.test_duration
-        self._results_lock = threading.Lock()
-        
-        # Start system metrics collection in a separate thread
-        metrics_thread = threading.Thread(target=self._collect_system_metrics)
-        metrics_thread.daemon = True
-        metrics_thread.start()
-        
-        # Create user threads
-        user_threads = []
-        with ThreadPoolExecutor(max_workers=self.config.concurrent_users) as executor:
-            for user_id in range(self.config.concurrent_users):
-                future = executor.submit(self._user, user_id)
-                user_threads.append(future)
-            
-            # Use a rich progress display
-            with Progress() as progress:
-                task = progress.add_task(
-                    "[cyan]Running load test...", 
-                    total=self.config.test_duration
-                )
-                
-                # Wait for test duration
-                elapsed = 0
-                while elapsed < self.config.test_duration:
-                    time.sleep(1)
-                    elapsed += 1
-                    progress.update(task, completed=elapsed)
-        
-        # Ensure end time is set
-        self.results.end_time = time.time()
-        
-        # Wait for metrics thread to finish
-        metrics_thread.join(timeout=2.0)
-        
+        self._stop_stats_writer()
         self._save_metrics()
         self._generate_report()
         self._print_summary()
@@ -951,15 +923,34 @@ class LoadTester:
     
     def run(self) -> TestResult:
         """Run the load test and return the results."""
-        if self.config.use_async:
-            # Use asyncio.run to handle the event loop
-            asyncio.run(self._run_async())
-        else:
-            self._run_threaded()
+        # Prefer the libuv-based event loop when it is installed
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(self._run_async())
         
         return self.results
 
 
+def _parse_header(value: str) -> Tuple[str, str]:
+    """Split a 'Key: Value' header argument into a (key, value) tuple."""
+    match = HEADER_PATTERN.match(value)
+    if not match:
+        raise argparse.ArgumentTypeError(
+            f"invalid header {value!r}, expected 'Key: Value'"
+        )
+    return match.group(1).strip(), match.group(2).strip()
+
+
+def _parse_param(value: str) -> Tuple[str, str]:
+    """Split a 'key=value' URL parameter argument into a (key, value) tuple."""
+    match = PARAM_PATTERN.match(value)
+    if not match:
+        raise argparse.ArgumentTypeError(
+            f"invalid parameter {value!r}, expected 'key=value'"
+        )
+    return match.group(1).strip(), match.group(2).strip()
+
+
 def main():
     """Command-line interface for the load tester."""
     parser = argparse.ArgumentParser(
@@ -1026,6 +1017,7 @@ def main():
     parser.add_argument(
         "--headers",
         action="append",
+        type=_parse_header,
         help="Request headers in format 'Key: Value'"
     )
     parser.add_argument(
@@ -1035,6 +1027,7 @@ def main():
     parser.add_argument(
         "--params",
         action="append",
+        type=_parse_param,
         help="URL parameters in format 'key=value'"
     )
     parser.add_argument(
@@ -1067,7 +1060,7 @@ def main():
     parser.add_argument(
         "--threaded",
         action="store_true",
-        help="Use threading instead of asyncio"
+        help="Deprecated: ignored, the load test always runs on asyncio"
     )
     parser.add_argument(
         "--verbose", "-v",
@@ -1077,25 +1070,23 @@ def main():
     
     args = parser.parse_args()
     
-    # Process headers
-    headers = {}
-    if args.headers:
-        for header in args.headers:
-            key, value = header.split(":", 1)
-            headers[key.strip()] = value.strip()
+    if args.threaded:
+        warnings.warn(
+            "--threaded is deprecated and has no effect; "
+            "the load test always runs on asyncio",
+            DeprecationWarning,
+            stacklevel=2
+        )
     
-    # Process URL parameters
-    params = {}
-    if args.params:
-        for param in args.params:
-            key, value = param.split("=", 1)
-            params[key.strip()] = value.strip()
+    # Headers and URL parameters arrive pre-split as (key, value) tuples
+    headers = dict(args.headers or ())
+    params = dict(args.params or ())
     
     # Process request data
     data = None
     if args.data:
         try:
-            data = json.loads(args.data)
+            data = _loads(args.data)
         except json.JSONDecodeError:
             print("Error: Request data must be valid JSON")
             sys.exit(1)
@@ -1122,7 +1113,6 @@ def main():
         think_time_min=args.think_time_min,
         think_time_max=args.think_time_max,
         request_timeout=args.timeout,
-        use_async=not args.threaded,
         max_retries=args.max_retries,
         retry_delay=args.retry_delay,
         output_dir=args.output_dir,
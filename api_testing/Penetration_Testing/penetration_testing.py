@@ -6,11 +6,19 @@ This script provides a modular penetration testing framework implementing
 various security testing techniques including network scanning, vulnerability
 assessment, web application testing, and password security evaluation.
 
+The framework also runs under PyPy, whose JIT suits its many small string
+and dict operations: orjson and cryptography are optional speedups with
+stdlib fallbacks, and requests, BeautifulSoup and lxml all support PyPy.
+
 For educational and authorized security testing purposes only.
 """
 
 import argparse
+import errno
+import select
+import selectors
 import socket
+import struct
 import ipaddress
 import threading
 import queue
@@ -20,31 +28,662 @@ import ssl
 import sys
 import os
 import json
-import hashlib
 import re
 import random
 import logging
+import logging.handlers
+import atexit
 import subprocess
+import ftplib
+import sqlite3
+from collections import Counter, deque
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple, Set, Optional, Union, Any
+from urllib.parse import (
+    ParseResult, urlparse, parse_qs, parse_qsl, quote_plus, urlencode, urlunparse
+)
+
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as URLLib3Error
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.etree
+import lxml.html
+
+try:
+    import orjson
+    
+    def _dumpb(obj: Any) -> bytes:
+        """Serialize an object to indented UTF-8 JSON"""
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+except ImportError:  # pragma: no cover - optional speedup
+    def _dumpb(obj: Any) -> bytes:
+        """Serialize an object to indented UTF-8 JSON"""
+        return json.dumps(obj, indent=2).encode()
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object to indented JSON text"""
+    return _dumpb(obj).decode()
+
+try:
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+    
+    def _cert_not_valid_after(cert: "x509.Certificate") -> datetime:
+        """Return a certificate's expiry as a naive UTC datetime"""
+        not_valid_after = getattr(cert, "not_valid_after_utc", None)
+        if not_valid_after is None:
+            return cert.not_valid_after
+        return not_valid_after.replace(tzinfo=None)
+except ImportError:  # pragma: no cover - optional speedup
+    x509 = None
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# Certificates are deliberately not verified when probing targets, so
+# silence the per-request warning urllib3 emits for that once at import
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-# Configure logging
+# Configure logging; records go through a queue to a listener thread so
+# scanner code never blocks on file or console writes
+_log_queue = queue.Queue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler("pentest.log"),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("pentest.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("PenTest")
 
+# Connections kept per host in the shared HTTP session pool
+HTTP_POOL_SIZE = 32
+
+# Worker threads used for concurrent web probes
+WEB_PROBE_WORKERS = 16
+
+# Worker threads used to check open ports for vulnerabilities
+VULN_SCAN_WORKERS = 16
+
+# Maximum number of sockets kept in flight by the port scanner, capped at
+# half the open-file limit so the HTTP session and log files keep room
+SCAN_BATCH_SIZE = 512
+if resource is not None:
+    _open_file_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    if _open_file_limit != resource.RLIM_INFINITY:
+        SCAN_BATCH_SIZE = max(1, min(SCAN_BATCH_SIZE, _open_file_limit // 2))
+
+# Service names for well-known ports (read-only)
+COMMON_SERVICES = MappingProxyType({
+    21: "ftp", 22: "ssh", 23: "telnet", 25: "smtp",
+    53: "dns", 80: "http", 110: "pop3", 111: "rpcbind",
+    135: "msrpc", 139: "netbios-ssn", 143: "imap",
+    443: "https", 445: "microsoft-ds", 993: "imaps",
+    995: "pop3s", 1723: "pptp", 3306: "mysql",
+    3389: "ms-wbt-server", 5900: "vnc", 8080: "http-proxy",
+    8443: "https-alt"
+})
+
+# Ports probed when no explicit port list is given
+COMMON_PORTS = (
+    21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 445,
+    993, 995, 1723, 3306, 3389, 5900, 8080, 8443
+)
+
+# Required security headers, keyed by lowercase name: (header, issue)
+SECURITY_HEADERS = {
+    "strict-transport-security": ("Strict-Transport-Security", "Missing HSTS header"),
+    "x-frame-options": ("X-Frame-Options", "Missing X-Frame-Options header"),
+    "x-content-type-options": ("X-Content-Type-Options", "Missing X-Content-Type-Options header"),
+    "content-security-policy": ("Content-Security-Policy", "Missing Content-Security-Policy header")
+}
+
+# Seconds to wait for a service to send its greeting banner
+BANNER_TIMEOUT = 0.5
+
+# Precompiled patterns for banner and ping output parsing
+SSH_BANNER_PATTERN = re.compile(r"SSH-(\d+\.\d+)-(\S+)")
+TTL_PATTERN = re.compile(rb"TTL=(\d+)", re.IGNORECASE)
+
+# Known vulnerable SSH server versions (simplified), e.g. "OpenSSH_4.3p2"
+VULNERABLE_SSH_PATTERN = re.compile(
+    r"^openssh[_-](?:1\.|2\.0|2\.1|2\.2|2\.3|2\.9|3\.0|3\.1|4\.0|4\.1|4\.2|4\.3)",
+    re.IGNORECASE
+)
+
+# Error patterns indicating SQL injection vulnerabilities
+SQL_ERROR_PATTERNS = (
+    "SQL syntax",
+    "mysql_fetch",
+    "ORA-",
+    "PostgreSQL",
+    "SQLite",
+    "Incorrect syntax",
+    "Unclosed quotation mark",
+    "mysql_query",
+    "pg_query"
+)
+
+# All SQL error patterns as one case-insensitive byte alternation, and the
+# pattern each lowercased match came from
+SQL_ERROR_PATTERN = re.compile(
+    b"|".join(re.escape(pattern.encode()) for pattern in SQL_ERROR_PATTERNS),
+    re.IGNORECASE
+)
+SQL_ERROR_NAMES = {pattern.lower().encode(): pattern for pattern in SQL_ERROR_PATTERNS}
+
+# Compiled XPath queries for link and form extraction
+LINK_HREFS_XPATH = lxml.etree.XPath("//a/@href")
+FORMS_XPATH = lxml.etree.XPath("//form")
+INPUTS_XPATH = lxml.etree.XPath(".//input")
+
+# Restricts BeautifulSoup to building <form> subtrees only
+FORMS_ONLY = SoupStrainer("form")
+
+# SQL injection payloads
+SQL_INJECTION_PAYLOADS = (
+    "' OR '1'='1",
+    "\" OR \"1\"=\"1",
+    "1' OR '1'='1' --",
+    "1\" OR \"1\"=\"1\" --",
+    "' OR 1=1 --",
+    "\" OR 1=1 --",
+    "' OR '1'='1' /*",
+    "\" OR \"1\"=\"1\" /*"
+)
+
+# XSS test payloads, and their encoded form for matching raw response bodies
+XSS_PAYLOADS = (
+    "<script>alert(1)</script>",
+    "\"><script>alert(1)</script>",
+    "'><script>alert(1)</script>",
+    "><script>alert(1)</script>",
+    "<img src=x onerror=alert(1)>",
+    "\"><img src=x onerror=alert(1)>",
+    "'><img src=x onerror=alert(1)>"
+)
+XSS_PAYLOAD_BYTES = {payload: payload.encode() for payload in XSS_PAYLOADS}
+
+# Common CSRF token field names, matched as substrings of lowercased
+# input names in a single regex search
+CSRF_FIELDS = (
+    "csrf", "csrf_token", "_csrf", "token", "authenticity_token",
+    "xsrf", "xsrf_token", "_xsrf", "csrfmiddlewaretoken"
+)
+CSRF_FIELD_PATTERN = re.compile("|".join(map(re.escape, CSRF_FIELDS)))
+
+# Raw-markup signature of a password input, used to skip parsing pages
+# that cannot hold a login form
+PASSWORD_INPUT_PATTERN = re.compile(rb"""type\s*=\s*["']?password""", re.IGNORECASE)
+
+# Parsed URLs kept by the memoized URL splitter
+URL_CACHE_SIZE = 2048
+
+# Placeholder for the injected value in payload URL templates; it survives
+# URL encoding unchanged
+PAYLOAD_MARKER = "__PENTEST_PAYLOAD__"
+
+# Canary values sent once per parameter before the full payload sets: a
+# quote pair that breaks either SQL string style, and a unique marker
+# carrying unescaped markup
+SQLI_CANARY = "'\""
+XSS_CANARY = "qx9z<svg/onload=1>qx9z"
+XSS_CANARY_BYTES = XSS_CANARY.encode()
+
+# Relative change in body length, versus the baseline, that counts as a
+# reaction to the SQL canary
+SQLI_LENGTH_TOLERANCE = 0.1
+
+# Paths probed for directory listings and exposed sensitive files
+WEB_TEST_DIRS = ("/images/", "/css/", "/js/", "/backup/", "/admin/")
+WEB_TEST_FILES = (
+    "/robots.txt",
+    "/.git/HEAD",
+    "/.env",
+    "/wp-config.php",
+    "/config.php",
+    "/.htaccess",
+    "/phpinfo.php"
+)
+
+# Files whose exposure on a web server leaks configuration or credentials
+SENSITIVE_FILES = (
+    "/.git/config",
+    "/.env",
+    "/config.php",
+    "/wp-config.php",
+    "/config.js",
+    "/config.yml",
+    "/config.xml",
+    "/credentials.txt",
+    "/database.yml",
+    "/settings.py",
+    "/.htpasswd",
+    "/.bash_history",
+    "/server-status",
+    "/phpinfo.php"
+)
+
+# Default location of the persistent scan cache, and how long each kind
+# of cached result stays fresh, in seconds
+SCAN_CACHE_PATH = "~/.pentest_cache.db"
+CERT_CACHE_TTL = 24 * 3600
+CRAWL_CACHE_TTL = 3600
+SENSITIVE_FILE_CACHE_TTL = 3600
+CREDENTIAL_CACHE_TTL = 7 * 24 * 3600
+
+# Concurrent login attempts when testing default credentials
+CREDENTIAL_TEST_WORKERS = 3
+
+# Web scan levels: how many of the leading SQL injection payloads, XSS
+# payloads and sensitive files each level tries; the lists are ordered
+# most general first
+SCAN_LEVELS = MappingProxyType({
+    "full": (len(SQL_INJECTION_PAYLOADS), len(XSS_PAYLOADS), len(SENSITIVE_FILES)),
+    "fast": (4, 4, 8),
+    "faster": (2, 2, 5),
+    "fastest": (1, 1, 3)
+})
+
+# Lowercase byte signatures of an auto-generated directory index page
+DIRECTORY_LISTING_MARKERS = (
+    b"index of",
+    b"<title>directory listing for",
+    b"parent directory"
+)
+
+# Bytes of a page read when looking for directory listing signatures
+DIRECTORY_LISTING_READ = 4096
+
+# Largest leftover response body read and discarded so a probe's connection
+# goes back to the pool; bigger bodies close the connection instead
+PROBE_DRAIN_LIMIT = 64 * 1024
+
+# Statuses meaning the server does not support HEAD for a URL
+HEAD_UNSUPPORTED = frozenset({405, 501})
+
+# Bytes of a candidate page read when looking for a login form
+LOGIN_PAGE_READ = 64 * 1024
+
+# ICMP message types and the Linux IP_RECVTTL option used by the TTL probe
+ICMP_ECHO_REPLY = 0
+ICMP_ECHO_REQUEST = 8
+IP_RECVTTL = getattr(socket, "IP_RECVTTL", 12)
+
+# Linux extended socket error reporting used by the parallel traceroute
+IP_RECVERR = getattr(socket, "IP_RECVERR", 11)
+SO_EE_ORIGIN_ICMP = 2
+TRACEROUTE_BASE_PORT = 33434
+
+# Linux can create the scan socket already non-blocking in one syscall;
+# Python sets close-on-exec on every new socket by itself
+SOCK_NONBLOCK = getattr(socket, "SOCK_NONBLOCK", 0)
+SCAN_SOCKET_TYPE = socket.SOCK_STREAM | SOCK_NONBLOCK
+
+# SO_LINGER value (on, 0s) that makes close() send RST and skip TIME_WAIT
+LINGER_RESET = struct.pack("ii", 1, 0)
+
+# connect_ex() results that mean a non-blocking connect is in progress
+CONNECT_PENDING = frozenset({
+    0,
+    errno.EINPROGRESS,
+    errno.EWOULDBLOCK,
+    getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)
+})
+
+# Translation table escaping the characters that are special in HTML text
+# and attribute values
+HTML_ESCAPES = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;"
+})
+
+# Finding severities, most severe first, and how the report's key findings
+# describe a count of each
+SEVERITY_LABELS = MappingProxyType({
+    "critical": "critical vulnerabilities",
+    "high": "high severity vulnerabilities",
+    "medium": "medium severity vulnerabilities",
+    "low": "low severity vulnerabilities",
+    "info": "informational findings"
+})
+
+# Static parts of the HTML report: the document head (formatted with the
+# target), the style sheet, the page header and summary opening, and the
+# closing footer
+REPORT_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Penetration Test Report: {}</title>
+"""
+REPORT_STYLE = """    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; color: #333; }
+        h1, h2, h3, h4 { color: #2c3e50; }
+        .container { max-width: 1200px; margin: 0 auto; }
+        .header { background-color: #34495e; color: white; padding: 20px; margin-bottom: 20px; }
+        .section { margin-bottom: 30px; border: 1px solid #ddd; padding: 20px; border-radius: 5px; }
+        .footer { margin-top: 50px; border-top: 1px solid #ddd; padding-top: 20px; text-align: center; }
+        table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }
+        th, td { padding: 12px 15px; border-bottom: 1px solid #ddd; text-align: left; }
+        th { background-color: #f2f2f2; }
+        tr:hover { background-color: #f5f5f5; }
+        .severity-critical { color: #fff; background-color: #e74c3c; padding: 5px 10px; border-radius: 3px; }
+        .severity-high { color: #fff; background-color: #e67e22; padding: 5px 10px; border-radius: 3px; }
+        .severity-medium { color: #fff; background-color: #f39c12; padding: 5px 10px; border-radius: 3px; }
+        .severity-low { color: #fff; background-color: #3498db; padding: 5px 10px; border-radius: 3px; }
+        .severity-info { color: #fff; background-color: #2ecc71; padding: 5px 10px; border-radius: 3px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+"""
+REPORT_HEADER = """        <div class="header">
+            <h1>Penetration Test Report</h1>
+            <p>Target: {target}</p>
+            <p>Start Time: {start_time}</p>
+            <p>Finish Time: {finish_time}</p>
+        </div>
+        
+        <div class="section">
+            <h2>Executive Summary</h2>
+            <p>This report presents the findings of a penetration test conducted against {target}.</p>
+            
+            <h3>Key Findings</h3>
+            <ul>
+"""
+REPORT_FOOTER = """        <div class="footer">
+            <p>This report was generated by the Python Penetration Testing Framework</p>
+            <p>For educational and authorized security testing purposes only</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# HTML report findings sections: a table's opening with its column headers,
+# its closing, and the section shown when there is nothing to list
+ISSUE_TABLE_START = """        <div class="section">
+            <h2>{}</h2>
+            <table>
+                <tr>
+                    <th>Name</th>
+                    <th>Severity</th>
+                    <th>Description</th>
+                    <th>Remediation</th>
+                </tr>
+"""
+TABLE_END = """            </table>
+        </div>
+        
+"""
+EMPTY_SECTION = """        <div class="section">
+            <h2>{}</h2>
+            <p>No findings.</p>
+        </div>
+        
+"""
+
+# HTML report table rows: open ports, and findings with a severity badge
+PORT_ROW = """                <tr>
+                    <td>{}</td>
+                    <td>{}</td>
+                    <td>{}</td>
+                    <td>{}</td>
+                </tr>
+"""
+ISSUE_ROW = """                <tr>
+                    <td>{}</td>
+                    <td><span class="severity-{}">{}</span></td>
+                    <td>{}</td>
+                    <td>{}</td>
+                </tr>
+"""
+
+
+# Certificate details per (hostname, port), filled by the web scanner's TLS check
+_ssl_info_cache = {}
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """Compute the RFC 1071 Internet checksum of data"""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _icmp_echo_request(identifier: int, sequence: int, payload: bytes) -> bytes:
+    """Build an ICMP echo request packet"""
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, identifier, sequence)
+    checksum = _icmp_checksum(header + payload)
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, checksum, identifier, sequence)
+    return header + payload
+
+
+def _parse_html(content: bytes) -> Optional[lxml.html.HtmlElement]:
+    """Parse an HTML body with lxml, returning None if there is no document"""
+    try:
+        return lxml.html.fromstring(content)
+    except (lxml.etree.ParserError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _split_url(url: str) -> Tuple[ParseResult, Dict[str, List[str]]]:
+    """
+    Parse a URL and its query parameters, memoized across the web checks.
+    
+    Args:
+        url: URL to parse
+        
+    Returns:
+        Tuple of the parsed URL and its query parameters; callers must
+        treat the parameter dictionary as read-only
+    """
+    parsed_url = urlparse(url)
+    return parsed_url, parse_qs(parsed_url.query) if parsed_url.query else {}
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalize a URL for deduplication.
+    
+    Lowercases the scheme and host, strips trailing slashes from the path,
+    sorts the query parameters and drops the fragment, so that spellings
+    of the same page compare equal.
+    
+    Args:
+        url: URL to normalize
+        
+    Returns:
+        Canonical form of the URL
+    """
+    parsed_url = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parsed_url.query, keep_blank_values=True)))
+    return urlunparse((
+        parsed_url.scheme.lower(),
+        parsed_url.netloc.lower(),
+        parsed_url.path.rstrip("/") or "/",
+        parsed_url.params,
+        query,
+        ""
+    ))
+
+
+def _read_banner(sock: socket.socket, timeout: float = BANNER_TIMEOUT) -> str:
+    """Return a connected service's greeting banner, or "" if it stays silent"""
+    ready, _, _ = select.select([sock], [], [], timeout)
+    if not ready:
+        return ""
+    return sock.recv(1024).decode("utf-8", errors="ignore").strip()
+
+
+def _drain(response: requests.Response) -> None:
+    """Discard the rest of a small streamed body so its connection is reused"""
+    try:
+        response.raw.read(PROBE_DRAIN_LIMIT, decode_content=False)
+    except (requests.RequestException, URLLib3Error, OSError):
+        pass
+
+
+def _escape_html(value: Any) -> str:
+    """Return a value as text that is safe to embed in the HTML report"""
+    return str(value).translate(HTML_ESCAPES)
+
+
+def _issue_row(issue: Dict[str, Any]) -> str:
+    """Render one finding as a row of the HTML report's issue tables"""
+    severity = str(issue.get("severity") or "info").lower()
+    return ISSUE_ROW.format(
+        _escape_html(issue.get("name", "N/A")),
+        _escape_html(severity),
+        _escape_html(severity.upper()),
+        _escape_html(issue.get("description", "N/A")),
+        _escape_html(issue.get("remediation", "N/A"))
+    )
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing a steady rate of requests per second"""
+    
+    def __init__(self, rate: float):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate: Requests allowed per second; up to one second's worth may
+                be sent in a burst
+        """
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until the caller may send one request"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token; a negative balance queues the caller behind
+            # earlier reservations
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        
+        if wait > 0:
+            time.sleep(wait)
+
+
+class SharedSSLAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools all reuse one SSLContext, with
+    optional limits on concurrent and per-second requests"""
+    
+    def __init__(self, ssl_context: ssl.SSLContext, max_concurrent: Optional[int] = None,
+                 rate_limiter: Optional[RateLimiter] = None, **kwargs):
+        self.ssl_context = ssl_context
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+    
+    def send(self, request, *args, **kwargs):
+        if self._slots is None:
+            return self._send(request, *args, **kwargs)
+        with self._slots:
+            return self._send(request, *args, **kwargs)
+    
+    def _send(self, request, *args, **kwargs):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return super().send(request, *args, **kwargs)
+
+
+class ScanCache:
+    """SQLite-backed store of check results that lets repeat scans skip probes"""
+    
+    def __init__(self, path: str = SCAN_CACHE_PATH):
+        """
+        Open (or create) the scan cache.
+        
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scan_cache ("
+            "target TEXT, check_name TEXT, key TEXT, result BLOB, ts INTEGER, "
+            "PRIMARY KEY (target, check_name, key))"
+        )
+    
+    def get(self, target: str, check: str, key: str, ttl: int) -> Any:
+        """
+        Look up a cached result.
+        
+        Args:
+            target: Scan target the result belongs to
+            check: Name of the check that produced it
+            key: Check-specific key, e.g. a URL
+            ttl: Maximum age in seconds for the result to count as fresh
+            
+        Returns:
+            The stored result, or None if it is missing or stale
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, ts FROM scan_cache "
+                "WHERE target = ? AND check_name = ? AND key = ?",
+                (target, check, key)
+            ).fetchone()
+        
+        if row is None or time.time() - row[1] > ttl:
+            return None
+        return json.loads(row[0])
+    
+    def put(self, target: str, check: str, key: str, result: Any) -> None:
+        """Store a JSON-serializable check result"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scan_cache VALUES (?, ?, ?, ?, ?)",
+                (target, check, key, json.dumps(result), int(time.time()))
+            )
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
+
 
 class PenetrationTest:
     """Main class for orchestrating penetration testing operations"""
     
-    def __init__(self, target: str, output_dir: str = "results", verbosity: int = 1):
+    def __init__(self, target: str, output_dir: str = "results", verbosity: int = 1,
+                 scan_level: str = "full", cache_path: Optional[str] = None,
+                 max_concurrent: Optional[int] = None, max_rps: Optional[float] = None):
         """
         Initialize the penetration testing framework.
         
@@ -52,10 +691,26 @@ class PenetrationTest:
             target: Target IP address, hostname, or URL
             output_dir: Directory to save results
             verbosity: Level of detail in output (1-3)
+            scan_level: Web scan thoroughness, one of SCAN_LEVELS
+            cache_path: SQLite file for reusing results across runs, or None
+                to always probe
+            max_concurrent: Maximum HTTP requests in flight at once, or None
+                for no limit beyond the worker pools
+            max_rps: Maximum HTTP requests started per second, or None for
+                no limit
         """
+        if scan_level not in SCAN_LEVELS:
+            raise ValueError(f"Unknown scan level: {scan_level}")
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1: {max_concurrent}")
+        if max_rps is not None and max_rps <= 0:
+            raise ValueError(f"max_rps must be positive: {max_rps}")
+        
         self.target = target
         self.output_dir = output_dir
         self.verbosity = verbosity
+        self.scan_level = scan_level
+        self.cache = ScanCache(cache_path) if cache_path else None
         self.results = {
             "metadata": {
                 "target": target,
@@ -69,6 +724,26 @@ class PenetrationTest:
             "summary": {}
         }
         
+        # Shared HTTP session so probes reuse pooled keep-alive connections.
+        # Targets are often self-signed, so certificates are not verified; one
+        # SSLContext is built for that up front instead of per connection.
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        
+        self.session = requests.Session()
+        self.session.verify = False
+        adapter = SharedSSLAdapter(
+            ssl_context,
+            max_concurrent=max_concurrent,
+            rate_limiter=RateLimiter(max_rps) if max_rps else None,
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=0
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
         # Initialize components
         self.network_scanner = NetworkScanner(self)
         self.vuln_scanner = VulnerabilityScanner(self)
@@ -118,30 +793,47 @@ class PenetrationTest:
             logger.error(f"Error during penetration test: {str(e)}")
             self.results["metadata"]["error"] = str(e)
             return self.results
+        
+        finally:
+            self.close()
+    
+    def close(self) -> None:
+        """Close the scan cache; later lookups simply miss"""
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+    
+    def cache_get(self, check: str, key: str, ttl: int) -> Any:
+        """Return a fresh cached result for this target, or None"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.target, check, key, ttl)
+    
+    def cache_put(self, check: str, key: str, result: Any) -> None:
+        """Cache a check result for this target if caching is enabled"""
+        if self.cache is not None:
+            self.cache.put(self.target, check, key, result)
     
     def summarize_findings(self) -> None:
         """Create a summary of all findings"""
+        # Count vulnerabilities by severity in one pass
+        severity_counts = Counter(
+            str(vuln.get("severity") or "info").lower()
+            for vuln in self.results.get("vulnerabilities", [])
+        )
+        
         summary = {
             "open_ports": len(self.results.get("network", {}).get("open_ports", [])),
             "vulnerabilities": {
-                "critical": 0,
-                "high": 0,
-                "medium": 0,
-                "low": 0,
-                "info": 0
+                severity: severity_counts[severity] for severity in SEVERITY_LABELS
             },
             "web_issues": len(self.results.get("web", {}).get("issues", [])),
             "password_issues": len(self.results.get("password", {}).get("issues", []))
         }
         
-        # Count vulnerabilities by severity
-        for vuln in self.results.get("vulnerabilities", []):
-            severity = vuln.get("severity", "info").lower()
-            if severity in summary["vulnerabilities"]:
-                summary["vulnerabilities"][severity] += 1
-        
         self.results["summary"] = summary
-        logger.info(f"Summary: {json.dumps(summary, indent=2)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Summary: %s", _dumps(summary))
 
 
 class NetworkScanner:
@@ -157,12 +849,13 @@ class NetworkScanner:
         self.parent = parent
         self.target = parent.target
         self.open_ports = []
+        self.unscanned_ports = []
         self.host_info = {}
-        self.port_queue = queue.Queue()
-        self.common_ports = [
-            21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 445, 
-            993, 995, 1723, 3306, 3389, 5900, 8080, 8443
-        ]
+        self.common_ports = COMMON_PORTS
+        
+        # Single-packet ping command line, minus the target address
+        count_flag = "-n" if os.name == "nt" else "-c"
+        self._ping_argv = ["ping", count_flag, "1"]
     
     def scan(self) -> Dict:
         """Perform comprehensive network scanning"""
@@ -186,12 +879,14 @@ class NetworkScanner:
         logger.info(f"Starting port scan on {ip_address}")
         open_ports = self._scan_ports(ip_address)
         results["open_ports"] = open_ports
+        if self.unscanned_ports:
+            results["unscanned_ports"] = self.unscanned_ports
         
         # Service detection
         services = {}
-        for port in open_ports:
-            service = self._detect_service(ip_address, port)
-            services[port] = service
+        for port_info in open_ports:
+            service = self._detect_service(ip_address, port_info)
+            services[port_info["port"]] = service
         
         results["services"] = services
         
@@ -202,83 +897,138 @@ class NetworkScanner:
         self.parent.results["network"] = results
         return results
     
-    def _scan_ports(self, ip_address: str, ports: List[int] = None) -> List[Dict]:
+    def _scan_ports(self, ip_address: str, ports: List[int] = None,
+                    timeout: float = 1.0) -> List[Dict]:
         """
         Scan for open ports on the target.
         
+        All connects in a batch are issued on non-blocking sockets and reaped
+        from a single selector, so a batch costs one timeout window instead of
+        one thread per port. Open connections are kept for up to
+        BANNER_TIMEOUT to capture the service's greeting banner, which is
+        stored in the port information as "banner".
+        
         Args:
             ip_address: Target IP address
             ports: List of ports to scan (default: common ports)
+            timeout: Seconds to wait for each batch of connects
             
         Returns:
-            List of dictionaries with port information
+            List of dictionaries with port information; ports that could not
+            be probed at all are listed in self.unscanned_ports
         """
         open_ports = []
+        self.unscanned_ports = []
         ports_to_scan = ports if ports else self.common_ports
         
-        # Queue up ports to scan
-        for port in ports_to_scan:
-            self.port_queue.put(port)
-        
-        # Create worker threads
-        threads = []
-        for _ in range(min(100, len(ports_to_scan))):
-            t = threading.Thread(target=self._port_scan_worker, 
-                                args=(ip_address, open_ports))
-            t.daemon = True
-            t.start()
-            threads.append(t)
-        
-        # Wait for all threads to complete
-        self.port_queue.join()
-        for t in threads:
-            t.join(1)
+        for start in range(0, len(ports_to_scan), SCAN_BATCH_SIZE):
+            batch = ports_to_scan[start:start + SCAN_BATCH_SIZE]
+            open_ports.extend(self._scan_port_batch(ip_address, batch, timeout))
         
         logger.info(f"Found {len(open_ports)} open ports")
         return open_ports
     
-    def _port_scan_worker(self, ip_address: str, results: List[Dict]) -> None:
-        """Worker thread for port scanning"""
-        while not self.port_queue.empty():
-            try:
-                port = self.port_queue.get(timeout=1)
-                
-                # TCP Connect scan
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex((ip_address, port))
+    def _scan_port_batch(self, ip_address: str, ports: List[int],
+                         timeout: float) -> List[Dict]:
+        """Connect to a batch of ports concurrently and return the open ones"""
+        open_ports = []
+        unscanned = []
+        error = None
+        selector = selectors.DefaultSelector()
+        
+        try:
+            # Start a non-blocking TCP connect for every port; a port whose
+            # socket cannot be set up (e.g. EMFILE) is skipped, not the batch
+            for port in ports:
+                sock = None
+                try:
+                    sock = socket.socket(socket.AF_INET, SCAN_SOCKET_TYPE)
+                    if not SOCK_NONBLOCK:
+                        sock.setblocking(False)
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RESET)
+                    result = sock.connect_ex((ip_address, port))
+                    
+                    if result not in CONNECT_PENDING:
+                        sock.close()
+                        continue
+                    
+                    selector.register(sock, selectors.EVENT_WRITE, port)
+                except OSError as e:
+                    if sock is not None:
+                        sock.close()
+                    unscanned.append(port)
+                    error = e
+            
+            # Reap connects as they complete, then read any greeting banners
+            # on the same connections, until the deadline
+            deadline = time.monotonic() + timeout + BANNER_TIMEOUT
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
                 
-                if result == 0:
+                for key, _ in selector.select(remaining):
+                    sock = key.fileobj
+                    
+                    if isinstance(key.data, dict):
+                        # Open port that has sent its banner (or closed)
+                        selector.unregister(sock)
+                        try:
+                            key.data["banner"] = sock.recv(1024).decode(
+                                "utf-8", errors="ignore"
+                            ).strip()
+                        except OSError:
+                            pass
+                        sock.close()
+                        continue
+                    
+                    port = key.data
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0:
+                        selector.unregister(sock)
+                        sock.close()
+                        continue
+                    
                     # Port is open
                     service_name = self._get_service_name(port)
                     port_info = {
                         "port": port,
                         "protocol": "tcp",
                         "state": "open",
-                        "service": service_name
+                        "service": service_name,
+                        "banner": ""
                     }
-                    results.append(port_info)
-                    logger.info(f"Port {port}/tcp is open: {service_name}")
-                
-                sock.close()
-                self.port_queue.task_done()
-                
-            except Exception as e:
-                logger.debug(f"Error scanning port: {str(e)}")
-                self.port_queue.task_done()
+                    open_ports.append(port_info)
+                    if self.parent.verbosity >= 2:
+                        logger.info("Port %d/tcp is open: %s", port, service_name)
+                    
+                    selector.modify(sock, selectors.EVENT_READ, port_info)
+        
+        except OSError as e:
+            # Connects still pending when the wait failed got no verdict
+            unscanned.extend(
+                key.data for key in selector.get_map().values()
+                if not isinstance(key.data, dict)
+            )
+            error = e
+        
+        finally:
+            # Anything still registered never answered (or sent no banner) in time
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+        
+        if unscanned:
+            logger.warning(
+                f"Could not scan {len(unscanned)} of {len(ports)} ports on "
+                f"{ip_address} ({error}); port scan results are incomplete"
+            )
+            self.unscanned_ports.extend(unscanned)
+        
+        return open_ports
     
     def _get_service_name(self, port: int) -> str:
         """Get service name for a standard port number"""
-        common_services = {
-            21: "ftp", 22: "ssh", 23: "telnet", 25: "smtp",
-            53: "dns", 80: "http", 110: "pop3", 111: "rpcbind",
-            135: "msrpc", 139: "netbios-ssn", 143: "imap",
-            443: "https", 445: "microsoft-ds", 993: "imaps",
-            995: "pop3s", 1723: "pptp", 3306: "mysql",
-            3389: "ms-wbt-server", 5900: "vnc", 8080: "http-proxy",
-            8443: "https-alt"
-        }
-        return common_services.get(port, "unknown")
+        return COMMON_SERVICES.get(port, "unknown")
     
     def _detect_service(self, ip_address: str, port_info: Dict) -> Dict:
         """
@@ -304,21 +1054,25 @@ class NetworkScanner:
             # Try to gather banner information
             if service in ["http", "https"]:
                 protocol = "https" if service == "https" else "http"
-                response = requests.get(
+                response = self.parent.session.get(
                     f"{protocol}://{ip_address}:{port}/",
-                    timeout=3,
-                    verify=False
+                    timeout=3
                 )
                 server = response.headers.get("Server", "")
                 service_details["product"] = server
                 service_details["extra_info"] = f"Status: {response.status_code}"
             
             elif service in ["ssh"]:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(3)
-                sock.connect((ip_address, port))
-                banner = sock.recv(1024).decode("utf-8", errors="ignore").strip()
-                sock.close()
+                # The scan's banner window is shared by the whole batch, so a
+                # slow greeter may have left it empty; ask again in that case
+                banner = port_info.get("banner")
+                if not banner:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    sock.settimeout(3)
+                    sock.connect((ip_address, port))
+                    banner = _read_banner(sock)
+                    sock.close()
+                    port_info["banner"] = banner
                 service_details["product"] = banner
             
             # More service detection methods could be added here
@@ -346,26 +1100,11 @@ class NetworkScanner:
         
         # This is a simplified OS detection based on TTL values
         try:
-            # Use a simple ping to get TTL
-            if os.name == "nt":  # Windows
-                ping_cmd = f"ping -n 1 {ip_address}"
-            else:  # Unix/Linux
-                ping_cmd = f"ping -c 1 {ip_address}"
-            
-            result = subprocess.run(
-                ping_cmd, 
-                shell=True, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE
-            )
-            
-            # Extract TTL from ping output
-            output = result.stdout.decode()
-            ttl_match = re.search(r"TTL=(\d+)", output, re.IGNORECASE)
+            ttl = self._icmp_ttl(ip_address)
+            if ttl is None:
+                ttl = self._ping_ttl(ip_address)
             
-            if ttl_match:
-                ttl = int(ttl_match.group(1))
-                
+            if ttl is not None:
                 # Very simplified OS fingerprinting based on initial TTL values
                 if ttl <= 64:
                     os_info = {"type": "Linux/Unix", "vendor": "Various", "confidence": 60}
@@ -379,6 +1118,88 @@ class NetworkScanner:
         
         return os_info
     
+    def _icmp_ttl(self, ip_address: str, timeout: float = 2.0) -> Optional[int]:
+        """
+        Send a single ICMP echo request and read the TTL of the reply.
+        
+        An unprivileged ICMP datagram socket is tried first (Linux with
+        net.ipv4.ping_group_range, macOS), then a raw socket, which needs
+        elevated privileges.
+        
+        Args:
+            ip_address: Target IP address
+            timeout: Seconds to wait for the echo reply
+            
+        Returns:
+            TTL of the reply, or None if no ICMP socket could be opened or
+            no reply arrived in time
+        """
+        identifier = os.getpid() & 0xFFFF
+        packet = _icmp_echo_request(identifier, 1, b"pentest-ttl-probe")
+        
+        for sock_type in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+            try:
+                sock = socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP)
+            except OSError:
+                continue
+            
+            with sock:
+                if sock_type == socket.SOCK_DGRAM:
+                    sock.setsockopt(socket.IPPROTO_IP, IP_RECVTTL, 1)
+                sock.sendto(packet, (ip_address, 0))
+                
+                deadline = time.monotonic() + timeout
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    sock.settimeout(remaining)
+                    
+                    try:
+                        if hasattr(sock, "recvmsg"):
+                            data, ancdata, _, addr = sock.recvmsg(
+                                1024, socket.CMSG_SPACE(4)
+                            )
+                        else:
+                            data, addr = sock.recvfrom(1024)
+                            ancdata = []
+                    except socket.timeout:
+                        return None
+                    
+                    if addr[0] != ip_address or not data:
+                        continue
+                    
+                    if data[0] >> 4 == 4:
+                        # Reply includes the IPv4 header; TTL is byte 8
+                        header_len = (data[0] & 0x0F) * 4
+                        icmp = data[header_len:]
+                        if (len(icmp) >= 8 and icmp[0] == ICMP_ECHO_REPLY and
+                                struct.unpack("!H", icmp[4:6])[0] == identifier):
+                            return data[8]
+                    elif data[0] == ICMP_ECHO_REPLY:
+                        # Datagram sockets strip the header; TTL comes as a cmsg
+                        for level, cmsg_type, cmsg_data in ancdata:
+                            if level == socket.IPPROTO_IP and cmsg_type == socket.IP_TTL:
+                                return int.from_bytes(cmsg_data[:4], sys.byteorder)
+                        return None
+        
+        return None
+    
+    def _ping_ttl(self, ip_address: str) -> Optional[int]:
+        """Read the reply TTL from the system ping command's output"""
+        # Use a simple ping to get TTL; no shell, so the address is never
+        # interpreted as a command line
+        result = subprocess.run(
+            self._ping_argv + [ip_address],
+            stdout=subprocess.PIPE, 
+            stderr=subprocess.PIPE
+        )
+        
+        # Extract TTL from the raw ping output without decoding it
+        ttl_match = TTL_PATTERN.search(result.stdout)
+        
+        return int(ttl_match.group(1)) if ttl_match else None
+    
     def _reverse_dns(self, ip_address: str) -> str:
         """Perform a reverse DNS lookup"""
         try:
@@ -387,10 +1208,119 @@ class NetworkScanner:
         except (socket.herror, socket.gaierror):
             return ip_address
     
-    def _traceroute(self, ip_address: str, max_hops: int = 10) -> List[Dict]:
+    def _traceroute(self, ip_address: str, max_hops: int = 10,
+                    timeout: float = 2.0) -> List[Dict]:
         """
         Perform a simple traceroute.
         
+        On Linux every TTL is probed at once on its own UDP socket and the
+        ICMP replies are read from each socket's error queue (IP_RECVERR),
+        so the whole trace takes one timeout window. Other platforms fall
+        back to probing one hop at a time.
+        
+        Args:
+            ip_address: Target IP address
+            max_hops: Maximum number of hops
+            timeout: Seconds to wait for replies
+            
+        Returns:
+            List of dictionaries with hop information
+        """
+        if not sys.platform.startswith("linux"):
+            return self._traceroute_sequential(ip_address, max_hops)
+        
+        hops = [
+            {"hop": ttl, "ip": "*", "hostname": "*", "rtt": None}
+            for ttl in range(1, max_hops + 1)
+        ]
+        send_times = {}
+        selector = selectors.DefaultSelector()
+        
+        try:
+            # Send one probe per TTL, all at once
+            for hop_info in hops:
+                ttl = hop_info["hop"]
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                    sock.setblocking(False)
+                    sock.setsockopt(socket.SOL_IP, socket.IP_TTL, ttl)
+                    sock.setsockopt(socket.SOL_IP, IP_RECVERR, 1)
+                    selector.register(sock, selectors.EVENT_READ, hop_info)
+                    send_times[ttl] = time.time()
+                    sock.sendto(b"", (ip_address, TRACEROUTE_BASE_PORT + ttl))
+                except OSError as e:
+                    logger.debug(f"Error in traceroute at hop {ttl}: {str(e)}")
+                    hop_info["ip"] = "Error"
+                    hop_info["hostname"] = str(e)
+            
+            # Collect ICMP replies until every hop answered or time runs out
+            deadline = time.monotonic() + timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                for key, _ in selector.select(remaining):
+                    sock = key.fileobj
+                    hop_info = key.data
+                    hop_ip = None
+                    
+                    try:
+                        _, ancdata, _, _ = sock.recvmsg(512, 512, socket.MSG_ERRQUEUE)
+                        for level, cmsg_type, cmsg_data in ancdata:
+                            # struct sock_extended_err followed by the offender's
+                            # sockaddr_in; the address sits at bytes 20-24
+                            if (level == socket.SOL_IP and cmsg_type == IP_RECVERR and
+                                    len(cmsg_data) >= 24 and cmsg_data[4] == SO_EE_ORIGIN_ICMP):
+                                hop_ip = socket.inet_ntoa(cmsg_data[20:24])
+                    except BlockingIOError:
+                        # No ICMP error queued; the target itself answered
+                        try:
+                            _, addr = sock.recvfrom(512)
+                            hop_ip = addr[0]
+                        except OSError as e:
+                            # Still readable, so drop the socket below rather
+                            # than let select() report it again at once
+                            logger.debug(f"Error in traceroute at hop {hop_info['hop']}: {str(e)}")
+                    except OSError as e:
+                        logger.debug(f"Error in traceroute at hop {hop_info['hop']}: {str(e)}")
+                    
+                    selector.unregister(sock)
+                    sock.close()
+                    
+                    if hop_ip:
+                        hop_info["ip"] = hop_ip
+                        hop_info["rtt"] = round(
+                            (time.time() - send_times[hop_info["hop"]]) * 1000, 2
+                        )
+        
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+        
+        # Keep hops up to the destination and resolve their names
+        trace = []
+        for hop_info in hops:
+            if hop_info["rtt"] is not None:
+                try:
+                    hostname, _, _ = socket.gethostbyaddr(hop_info["ip"])
+                    hop_info["hostname"] = hostname
+                except (socket.herror, socket.gaierror):
+                    hop_info["hostname"] = hop_info["ip"]
+            
+            trace.append(hop_info)
+            
+            # Stop if we reached the destination
+            if hop_info["ip"] == ip_address:
+                break
+        
+        return trace
+    
+    def _traceroute_sequential(self, ip_address: str, max_hops: int = 10) -> List[Dict]:
+        """
+        Perform a simple traceroute one hop at a time.
+        
         Args:
             ip_address: Target IP address
             max_hops: Maximum number of hops
@@ -475,29 +1405,11 @@ class VulnerabilityScanner:
             self.parent.results["vulnerabilities"] = vulnerabilities
             return vulnerabilities
         
-        # Scan each open port for vulnerabilities
-        for port_info in open_ports:
-            port = port_info["port"]
-            service = port_info["service"]
-            
-            logger.info(f"Scanning for vulnerabilities on port {port} ({service})")
-            
-            # Service-specific vulnerability checks
-            if service == "http" or service == "https":
-                web_vulns = self._check_web_vulnerabilities(port, service)
-                vulnerabilities.extend(web_vulns)
-            
-            elif service == "ssh":
-                ssh_vulns = self._check_ssh_vulnerabilities(port)
-                vulnerabilities.extend(ssh_vulns)
-            
-            elif service == "ftp":
-                ftp_vulns = self._check_ftp_vulnerabilities(port)
-                vulnerabilities.extend(ftp_vulns)
-            
-            # Generic service checks
-            generic_vulns = self._check_generic_vulnerabilities(port, service)
-            vulnerabilities.extend(generic_vulns)
+        # Scan the open ports concurrently; results keep the port order
+        workers = min(VULN_SCAN_WORKERS, len(open_ports))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for port_vulns in executor.map(self._scan_port, open_ports):
+                vulnerabilities.extend(port_vulns)
         
         # System vulnerability checks
         system_vulns = self._check_system_vulnerabilities()
@@ -507,6 +1419,33 @@ class VulnerabilityScanner:
         self.parent.results["vulnerabilities"] = vulnerabilities
         return vulnerabilities
     
+    def _scan_port(self, port_info: Dict) -> List[Dict]:
+        """Run the vulnerability checks for a single open port"""
+        vulnerabilities = []
+        port = port_info["port"]
+        service = port_info["service"]
+        
+        logger.info(f"Scanning for vulnerabilities on port {port} ({service})")
+        
+        # Service-specific vulnerability checks
+        if service == "http" or service == "https":
+            web_vulns = self._check_web_vulnerabilities(port, service)
+            vulnerabilities.extend(web_vulns)
+        
+        elif service == "ssh":
+            ssh_vulns = self._check_ssh_vulnerabilities(port, port_info.get("banner"))
+            vulnerabilities.extend(ssh_vulns)
+        
+        elif service == "ftp":
+            ftp_vulns = self._check_ftp_vulnerabilities(port)
+            vulnerabilities.extend(ftp_vulns)
+        
+        # Generic service checks
+        generic_vulns = self._check_generic_vulnerabilities(port, service)
+        vulnerabilities.extend(generic_vulns)
+        
+        return vulnerabilities
+    
     def _check_web_vulnerabilities(self, port: int, service: str) -> List[Dict]:
         """Check for web-specific vulnerabilities"""
         vulnerabilities = []
@@ -516,7 +1455,7 @@ class VulnerabilityScanner:
         
         try:
             # Check for server information disclosure
-            response = requests.get(base_url, timeout=5, verify=False)
+            response = self.parent.session.get(base_url, timeout=5)
             server_header = response.headers.get("Server", "")
             
             if server_header and len(server_header) > 0:
@@ -529,15 +1468,11 @@ class VulnerabilityScanner:
                 })
             
             # Check for missing security headers
-            security_headers = {
-                "Strict-Transport-Security": "Missing HSTS header",
-                "X-Frame-Options": "Missing X-Frame-Options header",
-                "X-Content-Type-Options": "Missing X-Content-Type-Options header",
-                "Content-Security-Policy": "Missing Content-Security-Policy header"
-            }
+            present_headers = {name.lower() for name in response.headers}
+            missing_headers = SECURITY_HEADERS.keys() - present_headers
             
-            for header, issue in security_headers.items():
-                if header not in response.headers:
+            for key, (header, issue) in SECURITY_HEADERS.items():
+                if key in missing_headers:
                     vulnerabilities.append({
                         "name": issue,
                         "description": f"The {header} security header is not set",
@@ -546,19 +1481,25 @@ class VulnerabilityScanner:
                         "remediation": f"Configure the web server to include the {header} header"
                     })
             
-            # Check for directory listing
-            test_dirs = ["/images/", "/css/", "/js/", "/backup/", "/admin/"]
-            for directory in test_dirs:
-                try:
-                    dir_url = f"{base_url}{directory}"
-                    dir_response = requests.get(dir_url, timeout=3, verify=False)
+            # Probe for directory listings and common files concurrently
+            dir_urls = tuple(base_url + directory for directory in WEB_TEST_DIRS)
+            file_urls = tuple(base_url + file for file in WEB_TEST_FILES)
+            
+            with ThreadPoolExecutor(max_workers=WEB_PROBE_WORKERS) as executor:
+                dir_responses = executor.map(self._probe_head, dir_urls)
+                file_statuses = executor.map(self._probe_status, file_urls)
+                
+                # Check for directory listing
+                for directory, dir_url, dir_response in zip(
+                    WEB_TEST_DIRS, dir_urls, dir_responses
+                ):
+                    if dir_response is None:
+                        continue
                     
                     # Simple check for directory listing patterns
-                    content = dir_response.text.lower()
-                    if (dir_response.status_code == 200 and 
-                        ("index of" in content or 
-                         "<title>directory listing for" in content or
-                         "parent directory" in content)):
+                    status_code, content = dir_response
+                    if (status_code == 200 and 
+                        any(marker in content for marker in DIRECTORY_LISTING_MARKERS)):
                         
                         vulnerabilities.append({
                             "name": "Directory Listing Enabled",
@@ -568,26 +1509,11 @@ class VulnerabilityScanner:
                             "remediation": "Disable directory listing in the web server configuration"
                         })
                 
-                except requests.RequestException:
-                    pass
-            
-            # Simple check for common files
-            test_files = [
-                "/robots.txt", 
-                "/.git/HEAD", 
-                "/.env", 
-                "/wp-config.php", 
-                "/config.php",
-                "/.htaccess",
-                "/phpinfo.php"
-            ]
-            
-            for file in test_files:
-                try:
-                    file_url = f"{base_url}{file}"
-                    file_response = requests.get(file_url, timeout=3, verify=False)
-                    
-                    if file_response.status_code == 200:
+                # Simple check for common files
+                for file, file_url, status_code in zip(
+                    WEB_TEST_FILES, file_urls, file_statuses
+                ):
+                    if status_code == 200:
                         vulnerabilities.append({
                             "name": "Sensitive File Exposure",
                             "description": f"Sensitive file {file} is accessible",
@@ -595,30 +1521,53 @@ class VulnerabilityScanner:
                             "evidence": f"File accessible at {file_url}",
                             "remediation": f"Remove or restrict access to {file}"
                         })
-                
-                except requests.RequestException:
-                    pass
             
         except Exception as e:
             logger.debug(f"Error checking web vulnerabilities: {str(e)}")
         
         return vulnerabilities
     
-    def _check_ssh_vulnerabilities(self, port: int) -> List[Dict]:
+    def _probe_head(self, url: str) -> Optional[Tuple[int, bytes]]:
+        """Fetch a URL's status and lowercased first bytes, or None on failure"""
+        try:
+            with self.parent.session.get(url, timeout=3, stream=True) as response:
+                head = response.raw.read(DIRECTORY_LISTING_READ, decode_content=True)
+                _drain(response)
+                return response.status_code, head.lower()
+        except (requests.RequestException, URLLib3Error):
+            return None
+    
+    def _probe_status(self, url: str) -> Optional[int]:
+        """Fetch a URL's status code without downloading the body"""
+        session = self.parent.session
+        try:
+            response = session.head(url, timeout=3, allow_redirects=True)
+            if response.status_code not in HEAD_UNSUPPORTED:
+                return response.status_code
+            
+            # Fall back to GET for servers that refuse HEAD
+            with session.get(url, timeout=3, stream=True) as response:
+                _drain(response)
+                return response.status_code
+        except (requests.RequestException, URLLib3Error):
+            return None
+    
+    def _check_ssh_vulnerabilities(self, port: int, banner: Optional[str] = None) -> List[Dict]:
         """Check for SSH-specific vulnerabilities"""
         vulnerabilities = []
         ip_address = self.parent.results.get("network", {}).get("ip_address", self.target)
         
         try:
-            # Connect to SSH to get banner
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(3)
-            sock.connect((ip_address, port))
-            banner = sock.recv(1024).decode("utf-8", errors="ignore").strip()
-            sock.close()
+            # Connect to SSH to get banner unless the port scan captured it
+            if not banner:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.settimeout(3)
+                sock.connect((ip_address, port))
+                banner = _read_banner(sock)
+                sock.close()
             
             # Check for outdated SSH versions
-            ssh_version_match = re.search(r"SSH-(\d+\.\d+)-([^\s]+)", banner)
+            ssh_version_match = SSH_BANNER_PATTERN.search(banner)
             if ssh_version_match:
                 protocol_version = ssh_version_match.group(1)
                 software_version = ssh_version_match.group(2)
@@ -633,22 +1582,14 @@ class VulnerabilityScanner:
                     })
                 
                 # Check for known vulnerable SSH versions (simplified)
-                vulnerable_versions = {
-                    "OpenSSH": ["1.", "2.0", "2.1", "2.2", "2.3", "2.9", "3.0", "3.1", "4.0", "4.1", "4.2", "4.3"]
-                }
-                
-                for vendor, versions in vulnerable_versions.items():
-                    if vendor.lower() in software_version.lower():
-                        for ver in versions:
-                            if software_version.lower().startswith(ver.lower()):
-                                vulnerabilities.append({
-                                    "name": "Vulnerable SSH Version",
-                                    "description": f"SSH server is running a potentially vulnerable version: {software_version}",
-                                    "severity": "high",
-                                    "evidence": f"SSH banner: {banner}",
-                                    "remediation": "Upgrade to the latest SSH server version"
-                                })
-                                break
+                if VULNERABLE_SSH_PATTERN.match(software_version):
+                    vulnerabilities.append({
+                        "name": "Vulnerable SSH Version",
+                        "description": f"SSH server is running a potentially vulnerable version: {software_version}",
+                        "severity": "high",
+                        "evidence": f"SSH banner: {banner}",
+                        "remediation": "Upgrade to the latest SSH server version"
+                    })
             
         except Exception as e:
             logger.debug(f"Error checking SSH vulnerabilities: {str(e)}")
@@ -661,16 +1602,8 @@ class VulnerabilityScanner:
         ip_address = self.parent.results.get("network", {}).get("ip_address", self.target)
         
         try:
-            # Connect to FTP to get banner
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(3)
-            sock.connect((ip_address, port))
-            banner = sock.recv(1024).decode("utf-8", errors="ignore").strip()
-            sock.close()
-            
             # Check for anonymous FTP access
             try:
-                import ftplib
                 ftp = ftplib.FTP()
                 ftp.connect(ip_address, port, timeout=5)
                 
@@ -736,7 +1669,6 @@ class VulnerabilityScanner:
     def _check_ftps_support(self, ip_address: str, port: int) -> bool:
         """Check if FTP server supports FTPS (TLS/SSL)"""
         try:
-            import ftplib
             ftp = ftplib.FTP()
             ftp.connect(ip_address, port, timeout=5)
             
@@ -846,10 +1778,23 @@ class WebApplicationScanner:
         """
         self.parent = parent
         self.target = parent.target
+        self.session = parent.session
         self.results = {
             "target_url": "",
             "issues": []
         }
+        
+        # Parsed pages (None if not HTML) by canonical URL, filled by the crawler
+        self._page_cache = {}
+        
+        # Unmodified (status code, body length) per URL for the canary probes
+        self._baseline_cache = {}
+        
+        # Payload and sensitive file subsets for the configured scan level
+        sql_count, xss_count, file_count = SCAN_LEVELS[parent.scan_level]
+        self.sql_payloads = SQL_INJECTION_PAYLOADS[:sql_count]
+        self.xss_payloads = XSS_PAYLOADS[:xss_count]
+        self.sensitive_files = SENSITIVE_FILES[:file_count]
     
     def scan(self) -> Dict:
         """Perform web application security scanning"""
@@ -893,68 +1838,136 @@ class WebApplicationScanner:
         if not url.startswith("https"):
             return
         
-        hostname = url.split("://")[1].split(":")[0]
+        parsed_url = urlparse(url)
+        hostname = parsed_url.hostname
         
         try:
-            # Get SSL certificate information
-            context = ssl.create_default_context()
-            with socket.create_connection((hostname, 443)) as sock:
-                with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                    cert = ssock.getpeercert()
-                    
-                    # Check certificate expiration
-                    not_after = cert.get("notAfter", "")
-                    if not_after:
-                        expiry_date = datetime.strptime(not_after, "%b %d %H:%M:%S %Y %Z")
-                        now = datetime.now()
-                        days_until_expiry = (expiry_date - now).days
-                        
-                        if days_until_expiry < 0:
-                            self.results["issues"].append({
-                                "name": "Expired SSL Certificate",
-                                "description": "The SSL certificate has expired",
-                                "severity": "critical",
-                                "evidence": f"Certificate expired on {not_after}",
-                                "remediation": "Renew the SSL certificate immediately"
-                            })
-                        elif days_until_expiry < 30:
-                            self.results["issues"].append({
-                                "name": "SSL Certificate Expiring Soon",
-                                "description": f"The SSL certificate will expire in {days_until_expiry} days",
-                                "severity": "high",
-                                "evidence": f"Certificate expires on {not_after}",
-                                "remediation": "Renew the SSL certificate before it expires"
-                            })
-                    
-                    # Check certificate subject
-                    subject = dict(x[0] for x in cert.get("subject", []))
-                    common_name = subject.get("commonName", "")
-                    
-                    if common_name != hostname and not (
-                        common_name.startswith("*.") and 
-                        hostname.endswith(common_name[1:])
-                    ):
-                        self.results["issues"].append({
-                            "name": "SSL Certificate Hostname Mismatch",
-                            "description": f"The SSL certificate is issued for {common_name}, not {hostname}",
-                            "severity": "high",
-                            "evidence": f"Certificate CN: {common_name}, Hostname: {hostname}",
-                            "remediation": "Obtain a certificate valid for this hostname"
-                        })
-                    
-                    # Check protocol version
-                    version = ssock.version()
-                    if version == "TLSv1" or version == "TLSv1.1":
-                        self.results["issues"].append({
-                            "name": "Outdated TLS Protocol",
-                            "description": f"Server is using outdated {version} protocol",
-                            "severity": "medium",
-                            "evidence": f"TLS Version: {version}",
-                            "remediation": "Configure server to use TLS 1.2 or 1.3 only"
-                        })
+            # Get SSL certificate information, handshaking only once per host
+            cert_info = self._get_ssl_info(hostname, parsed_url.port or 443)
+            
+            # Check certificate expiration
+            not_after = cert_info["not_after"]
+            if not_after:
+                now = datetime.now()
+                days_until_expiry = (cert_info["expiry_date"] - now).days
+                
+                if days_until_expiry < 0:
+                    self.results["issues"].append({
+                        "name": "Expired SSL Certificate",
+                        "description": "The SSL certificate has expired",
+                        "severity": "critical",
+                        "evidence": f"Certificate expired on {not_after}",
+                        "remediation": "Renew the SSL certificate immediately"
+                    })
+                elif days_until_expiry < 30:
+                    self.results["issues"].append({
+                        "name": "SSL Certificate Expiring Soon",
+                        "description": f"The SSL certificate will expire in {days_until_expiry} days",
+                        "severity": "high",
+                        "evidence": f"Certificate expires on {not_after}",
+                        "remediation": "Renew the SSL certificate before it expires"
+                    })
+            
+            # Check certificate subject
+            common_name = cert_info["common_name"]
+            
+            if common_name != hostname and not (
+                common_name.startswith("*.") and 
+                hostname.endswith(common_name[1:])
+            ):
+                self.results["issues"].append({
+                    "name": "SSL Certificate Hostname Mismatch",
+                    "description": f"The SSL certificate is issued for {common_name}, not {hostname}",
+                    "severity": "high",
+                    "evidence": f"Certificate CN: {common_name}, Hostname: {hostname}",
+                    "remediation": "Obtain a certificate valid for this hostname"
+                })
+            
+            # Check protocol version
+            version = cert_info["version"]
+            if version == "TLSv1" or version == "TLSv1.1":
+                self.results["issues"].append({
+                    "name": "Outdated TLS Protocol",
+                    "description": f"Server is using outdated {version} protocol",
+                    "severity": "medium",
+                    "evidence": f"TLS Version: {version}",
+                    "remediation": "Configure server to use TLS 1.2 or 1.3 only"
+                })
+        
+        except Exception as e:
+            logger.debug(f"Error checking SSL security: {str(e)}")
+    
+    def _get_ssl_info(self, hostname: str, port: int) -> Dict:
+        """
+        Get the certificate details and protocol version of a TLS endpoint.
+        
+        The handshake and certificate parsing happen once per (hostname, port)
+        per process; later calls return the cached details, leaving only the
+        time-dependent expiry check to the caller.
         
-        except Exception as e:
-            logger.debug(f"Error checking SSL security: {str(e)}")
+        Args:
+            hostname: Server hostname
+            port: Server port
+            
+        Returns:
+            Dictionary with not_after, expiry_date, common_name and version
+        """
+        key = (hostname, port)
+        cert_info = _ssl_info_cache.get(key)
+        if cert_info is not None:
+            return cert_info
+        
+        cache_key = f"{hostname}:{port}"
+        cached = self.parent.cache_get("ssl", cache_key, CERT_CACHE_TTL)
+        if cached is not None:
+            expiry_date = cached["expiry_date"]
+            cached["expiry_date"] = (
+                datetime.fromisoformat(expiry_date) if expiry_date else None
+            )
+            _ssl_info_cache[key] = cached
+            return cached
+        
+        context = ssl.create_default_context()
+        with socket.create_connection((hostname, port)) as sock:
+            with context.wrap_socket(sock, server_hostname=hostname) as ssock:
+                if x509 is not None:
+                    der = ssock.getpeercert(binary_form=True)
+                else:
+                    cert = ssock.getpeercert()
+                version = ssock.version()
+        
+        if x509 is not None:
+            # Parse the DER certificate natively instead of walking the
+            # nested tuples of getpeercert()
+            cert_obj = x509.load_der_x509_certificate(der)
+            expiry_date = _cert_not_valid_after(cert_obj)
+            not_after = (
+                f"{expiry_date:%b} {expiry_date.day:2d} {expiry_date:%H:%M:%S %Y} GMT"
+            )
+            names = cert_obj.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
+            common_name = names[0].value if names else ""
+        else:
+            not_after = cert.get("notAfter", "")
+            expiry_date = (
+                datetime.strptime(not_after, "%b %d %H:%M:%S %Y %Z")
+                if not_after else None
+            )
+            subject = dict(x[0] for x in cert.get("subject", []))
+            common_name = subject.get("commonName", "")
+        
+        cert_info = {
+            "not_after": not_after,
+            "expiry_date": expiry_date,
+            "common_name": common_name,
+            "version": version
+        }
+        
+        _ssl_info_cache[key] = cert_info
+        self.parent.cache_put("ssl", cache_key, {
+            **cert_info,
+            "expiry_date": expiry_date.isoformat() if expiry_date else None
+        })
+        return cert_info
     
     def _crawl_website(self, url: str) -> List[str]:
         """
@@ -966,60 +1979,91 @@ class WebApplicationScanner:
         Returns:
             List of discovered URLs
         """
-        discovered_urls = set([url])
-        urls_to_visit = [url]
+        cached = self.parent.cache_get("crawl", url, CRAWL_CACHE_TTL)
+        if cached is not None:
+            self.results["crawled_urls"] = cached
+            return list(cached)
+        
+        # URLs are deduplicated by canonical form; discovered_urls maps each
+        # canonical URL to the first spelling seen
+        discovered_urls = {_canonical_url(url): url}
+        urls_to_visit = deque([url])
         visited_urls = set()
         max_urls = 20  # Limit for the demonstration
+        base_netloc = urlparse(url).netloc
+        completed = False
         
         try:
-            while urls_to_visit and len(visited_urls) < max_urls:
-                current_url = urls_to_visit.pop(0)
-                
-                if current_url in visited_urls:
-                    continue
-                
-                logger.info(f"Crawling: {current_url}")
-                
-                try:
-                    response = requests.get(current_url, timeout=5, verify=False)
-                    visited_urls.add(current_url)
+            with ThreadPoolExecutor(max_workers=WEB_PROBE_WORKERS) as executor:
+                while urls_to_visit and len(visited_urls) < max_urls:
+                    # Take the next batch of unvisited URLs, up to the crawl limit
+                    batch = {}
+                    while urls_to_visit and len(visited_urls) + len(batch) < max_urls:
+                        current_url = urls_to_visit.popleft()
+                        key = _canonical_url(current_url)
+                        if key not in visited_urls and key not in batch:
+                            batch[key] = current_url
                     
-                    # Parse HTML and extract links
-                    if "text/html" in response.headers.get("Content-Type", ""):
-                        soup = BeautifulSoup(response.text, "html.parser")
+                    # Fetch the batch concurrently; pages come back in batch order
+                    pages = executor.map(self._fetch_page, batch.values())
+                    for (key, current_url), response in zip(batch.items(), pages):
+                        if response is None:
+                            continue
                         
-                        for link in soup.find_all("a", href=True):
-                            href = link["href"]
-                            
+                        visited_urls.add(key)
+                        
+                        # Parse HTML and extract links; the parsed page is kept
+                        # for the form checks (None if it is not HTML)
+                        tree = None
+                        if "text/html" in response.headers.get("Content-Type", ""):
+                            tree = _parse_html(response.content)
+                        
+                        self._page_cache[key] = tree
+                        if tree is None:
+                            continue
+                        
+                        parsed_url = urlparse(current_url)
+                        
+                        for href in LINK_HREFS_XPATH(tree):
                             # Normalize URL
                             if href.startswith("/"):
                                 # Convert relative URL to absolute
-                                parsed_url = urlparse(current_url)
                                 absolute_url = f"{parsed_url.scheme}://{parsed_url.netloc}{href}"
                             elif href.startswith("http"):
                                 # Already absolute URL
                                 absolute_url = href
                             else:
                                 # Relative URL (not starting with /)
-                                parsed_url = urlparse(current_url)
                                 path = os.path.dirname(parsed_url.path)
                                 absolute_url = f"{parsed_url.scheme}://{parsed_url.netloc}{path}/{href}"
                             
                             # Only add URLs from the same domain
-                            if urlparse(absolute_url).netloc == urlparse(url).netloc:
-                                discovered_urls.add(absolute_url)
-                                if absolute_url not in visited_urls:
+                            if urlparse(absolute_url).netloc == base_netloc:
+                                key = _canonical_url(absolute_url)
+                                if key not in discovered_urls:
+                                    discovered_urls[key] = absolute_url
                                     urls_to_visit.append(absolute_url)
-                
-                except requests.RequestException as e:
-                    logger.debug(f"Error crawling {current_url}: {str(e)}")
+            completed = True
         
         except Exception as e:
             logger.error(f"Error during website crawling: {str(e)}")
         
-        # Save discovered URLs to results
-        self.results["crawled_urls"] = list(discovered_urls)
-        return list(discovered_urls)
+        # Save discovered URLs to results; only a crawl that ran to the end
+        # is cached, so an interrupted one is not reused by later runs
+        self.results["crawled_urls"] = list(discovered_urls.values())
+        if completed:
+            self.parent.cache_put("crawl", url, self.results["crawled_urls"])
+        return list(discovered_urls.values())
+    
+    def _fetch_page(self, url: str) -> Optional[requests.Response]:
+        """Fetch a page for the crawler, returning None if the request fails"""
+        logger.info(f"Crawling: {url}")
+        
+        try:
+            return self.session.get(url, timeout=5)
+        except requests.RequestException as e:
+            logger.debug(f"Error crawling {url}: {str(e)}")
+            return None
     
     def _check_common_vulnerabilities(self, url: str) -> None:
         """Check for common web vulnerabilities"""
@@ -1045,73 +2089,42 @@ class WebApplicationScanner:
         # Simple SQL injection check on discovered pages with parameters
         discovered_urls = self.results.get("crawled_urls", [base_url])
         
-        # SQL injection payloads
-        payloads = [
-            "' OR '1'='1",
-            "\" OR \"1\"=\"1",
-            "1' OR '1'='1' --",
-            "1\" OR \"1\"=\"1\" --",
-            "' OR 1=1 --",
-            "\" OR 1=1 --",
-            "' OR '1'='1' /*",
-            "\" OR \"1\"=\"1\" /*"
-        ]
-        
-        # Error patterns indicating SQL injection vulnerabilities
-        error_patterns = [
-            "SQL syntax",
-            "mysql_fetch",
-            "ORA-",
-            "PostgreSQL",
-            "SQLite",
-            "Incorrect syntax",
-            "Unclosed quotation mark",
-            "mysql_query",
-            "pg_query"
-        ]
-        
         for url in discovered_urls:
-            # Check if URL has parameters
-            parsed_url = urlparse(url)
-            if parsed_url.query:
-                # Extract parameters
-                params = parse_qs(parsed_url.query)
-                
-                for param_name, param_values in params.items():
-                    original_value = param_values[0]
+            # Check if URL has parameters; parsing is shared across checks
+            parsed_url, params = _split_url(url)
+            if params:
+                for param_name in params:
+                    template = self._payload_template(parsed_url, params, param_name)
                     
-                    for payload in payloads:
+                    # Send the full payload set only if a canary disturbs the page
+                    if not self._sql_canary_reacts(url, template):
+                        continue
+                    
+                    for payload in self.sql_payloads:
                         # Create modified URL with SQL injection payload
-                        modified_params = params.copy()
-                        modified_params[param_name] = [payload]
-                        
-                        modified_query = urlencode(modified_params, doseq=True)
-                        modified_url = urlunparse((
-                            parsed_url.scheme,
-                            parsed_url.netloc,
-                            parsed_url.path,
-                            parsed_url.params,
-                            modified_query,
-                            parsed_url.fragment
-                        ))
+                        modified_url = template.replace(
+                            PAYLOAD_MARKER, quote_plus(payload), 1
+                        )
                         
                         try:
-                            response = requests.get(modified_url, timeout=5, verify=False)
+                            response = self.session.get(modified_url, timeout=5)
                             
-                            # Check for error messages indicating SQL injection
-                            for pattern in error_patterns:
-                                if pattern.lower() in response.text.lower():
-                                    self.results["issues"].append({
-                                        "name": "Potential SQL Injection",
-                                        "description": f"Parameter {param_name} may be vulnerable to SQL injection",
-                                        "severity": "critical",
-                                        "evidence": f"SQL error pattern '{pattern}' found in response",
-                                        "url": url,
-                                        "parameter": param_name,
-                                        "payload": payload,
-                                        "remediation": "Use parameterized queries or prepared statements"
-                                    })
-                                    break
+                            # Check for error messages indicating SQL injection;
+                            # one pass over the raw body finds any of the patterns
+                            match = SQL_ERROR_PATTERN.search(response.content)
+                            if match:
+                                pattern = SQL_ERROR_NAMES[match.group().lower()]
+                                self.results["issues"].append({
+                                    "name": "Potential SQL Injection",
+                                    "description": f"Parameter {param_name} may be vulnerable to SQL injection",
+                                    "severity": "critical",
+                                    "evidence": f"SQL error pattern '{pattern}' found in response",
+                                    "url": url,
+                                    "parameter": param_name,
+                                    "payload": payload,
+                                    "remediation": "Use parameterized queries or prepared statements"
+                                })
+                                break
                         
                         except requests.RequestException as e:
                             logger.debug(f"Error testing SQL injection: {str(e)}")
@@ -1126,47 +2139,28 @@ class WebApplicationScanner:
         # Simple XSS check on discovered pages with parameters
         discovered_urls = self.results.get("crawled_urls", [base_url])
         
-        # XSS test payloads
-        payloads = [
-            "<script>alert(1)</script>",
-            "\"><script>alert(1)</script>",
-            "'><script>alert(1)</script>",
-            "><script>alert(1)</script>",
-            "<img src=x onerror=alert(1)>",
-            "\"><img src=x onerror=alert(1)>",
-            "'><img src=x onerror=alert(1)>"
-        ]
-        
         for url in discovered_urls:
-            # Check if URL has parameters
-            parsed_url = urlparse(url)
-            if parsed_url.query:
-                # Extract parameters
-                params = parse_qs(parsed_url.query)
-                
-                for param_name, param_values in params.items():
-                    original_value = param_values[0]
+            # Check if URL has parameters; parsing is shared across checks
+            parsed_url, params = _split_url(url)
+            if params:
+                for param_name in params:
+                    template = self._payload_template(parsed_url, params, param_name)
+                    
+                    # Send the full payload set only if a canary is reflected
+                    if not self._xss_canary_reflected(template):
+                        continue
                     
-                    for payload in payloads:
+                    for payload in self.xss_payloads:
                         # Create modified URL with XSS payload
-                        modified_params = params.copy()
-                        modified_params[param_name] = [payload]
-                        
-                        modified_query = urlencode(modified_params, doseq=True)
-                        modified_url = urlunparse((
-                            parsed_url.scheme,
-                            parsed_url.netloc,
-                            parsed_url.path,
-                            parsed_url.params,
-                            modified_query,
-                            parsed_url.fragment
-                        ))
+                        modified_url = template.replace(
+                            PAYLOAD_MARKER, quote_plus(payload), 1
+                        )
                         
                         try:
-                            response = requests.get(modified_url, timeout=5, verify=False)
+                            response = self.session.get(modified_url, timeout=5)
                             
-                            # Check if the payload is reflected in the response
-                            if payload in response.text:
+                            # Check if the payload is reflected in the raw response
+                            if XSS_PAYLOAD_BYTES[payload] in response.content:
                                 self.results["issues"].append({
                                     "name": "Potential Cross-Site Scripting (XSS)",
                                     "description": f"Parameter {param_name} may be vulnerable to XSS",
@@ -1182,6 +2176,88 @@ class WebApplicationScanner:
                         except requests.RequestException as e:
                             logger.debug(f"Error testing XSS: {str(e)}")
     
+    def _payload_template(self, parsed_url: ParseResult, params: Dict[str, List[str]],
+                          param_name: str) -> str:
+        """
+        Build a URL with one query parameter's value replaced by PAYLOAD_MARKER.
+        
+        Payload URLs are then made with a single str.replace of the marker
+        instead of re-encoding the query and rebuilding the URL per payload.
+        
+        Args:
+            parsed_url: Parsed URL to inject into
+            params: Parsed query parameters of the URL
+            param_name: Parameter whose value is replaced
+            
+        Returns:
+            URL template containing PAYLOAD_MARKER once
+        """
+        modified_params = params.copy()
+        modified_params[param_name] = [PAYLOAD_MARKER]
+        
+        modified_query = urlencode(modified_params, doseq=True)
+        return urlunparse((
+            parsed_url.scheme,
+            parsed_url.netloc,
+            parsed_url.path,
+            parsed_url.params,
+            modified_query,
+            parsed_url.fragment
+        ))
+    
+    def _get_baseline(self, url: str) -> Optional[Tuple[int, int]]:
+        """Return the (status code, body length) of an unmodified URL, cached"""
+        if url not in self._baseline_cache:
+            try:
+                response = self.session.get(url, timeout=5)
+                self._baseline_cache[url] = (response.status_code, len(response.content))
+            except requests.RequestException as e:
+                logger.debug(f"Error fetching baseline for {url}: {str(e)}")
+                self._baseline_cache[url] = None
+        
+        return self._baseline_cache[url]
+    
+    def _sql_canary_reacts(self, url: str, template: str) -> bool:
+        """
+        Probe a parameter with the SQL canary and compare against the baseline.
+        
+        Args:
+            url: Original URL
+            template: Payload template for the parameter to probe
+            
+        Returns:
+            True if the parameter warrants the full SQL injection payload set
+        """
+        baseline = self._get_baseline(url)
+        canary_url = template.replace(PAYLOAD_MARKER, quote_plus(SQLI_CANARY), 1)
+        
+        try:
+            response = self.session.get(canary_url, timeout=5)
+        except requests.RequestException as e:
+            logger.debug(f"Error testing SQL injection: {str(e)}")
+            return True
+        
+        if baseline is None or SQL_ERROR_PATTERN.search(response.content):
+            return True
+        
+        status_code, length = baseline
+        return (
+            response.status_code != status_code or
+            abs(len(response.content) - length) > SQLI_LENGTH_TOLERANCE * max(length, 1)
+        )
+    
+    def _xss_canary_reflected(self, template: str) -> bool:
+        """Probe a parameter with the XSS canary and report whether it is echoed back"""
+        canary_url = template.replace(PAYLOAD_MARKER, quote_plus(XSS_CANARY), 1)
+        
+        try:
+            response = self.session.get(canary_url, timeout=5)
+        except requests.RequestException as e:
+            logger.debug(f"Error testing XSS: {str(e)}")
+            return True
+        
+        return XSS_CANARY_BYTES in response.content
+    
     def _check_csrf(self, base_url: str) -> None:
         """
         Check for Cross-Site Request Forgery (CSRF) protection.
@@ -1192,44 +2268,68 @@ class WebApplicationScanner:
         # Find forms on the website
         discovered_urls = self.results.get("crawled_urls", [base_url])
         
-        for url in discovered_urls:
-            try:
-                response = requests.get(url, timeout=5, verify=False)
+        # Pages the crawler did not fetch (e.g. on a cached crawl) are
+        # fetched concurrently
+        with ThreadPoolExecutor(max_workers=WEB_PROBE_WORKERS) as executor:
+            trees = list(executor.map(self._get_page, discovered_urls))
+        
+        for url, tree in zip(discovered_urls, trees):
+            if tree is None:
+                continue
+            
+            # Find forms
+            for form in FORMS_XPATH(tree):
+                # Check for CSRF token
+                csrf_found = False
                 
-                if "text/html" in response.headers.get("Content-Type", ""):
-                    soup = BeautifulSoup(response.text, "html.parser")
+                for field in INPUTS_XPATH(form):
+                    field_name = field.get("name", "").lower()
                     
-                    # Find forms
-                    forms = soup.find_all("form")
-                    for form in forms:
-                        # Check for CSRF token
-                        csrf_found = False
-                        
-                        # Common CSRF token field names
-                        csrf_fields = [
-                            "csrf", "csrf_token", "_csrf", "token", "authenticity_token",
-                            "xsrf", "xsrf_token", "_xsrf", "csrfmiddlewaretoken"
-                        ]
-                        
-                        for field in form.find_all("input"):
-                            field_name = field.get("name", "").lower()
-                            
-                            if any(token_name in field_name for token_name in csrf_fields):
-                                csrf_found = True
-                                break
-                        
-                        if not csrf_found and form.get("method", "").lower() == "post":
-                            self.results["issues"].append({
-                                "name": "Missing CSRF Protection",
-                                "description": "A form was found without CSRF protection",
-                                "severity": "medium",
-                                "evidence": f"Form action: {form.get('action', 'unknown')}",
-                                "url": url,
-                                "remediation": "Implement CSRF tokens for all POST forms"
-                            })
+                    if CSRF_FIELD_PATTERN.search(field_name):
+                        csrf_found = True
+                        break
+                
+                if not csrf_found and form.get("method", "").lower() == "post":
+                    self.results["issues"].append({
+                        "name": "Missing CSRF Protection",
+                        "description": "A form was found without CSRF protection",
+                        "severity": "medium",
+                        "evidence": f"Form action: {form.get('action', 'unknown')}",
+                        "url": url,
+                        "remediation": "Implement CSRF tokens for all POST forms"
+                    })
+    
+    def _get_page(self, url: str) -> Optional[lxml.html.HtmlElement]:
+        """
+        Get the parsed HTML of a page, reusing the crawler's copy if it has one.
+        
+        Args:
+            url: Page URL
             
+        Returns:
+            Parsed page, or None if the page is not HTML or cannot be fetched
+        """
+        key = _canonical_url(url)
+        if key not in self._page_cache:
+            try:
+                response = self.session.get(url, timeout=5)
             except requests.RequestException as e:
                 logger.debug(f"Error checking CSRF: {str(e)}")
+                return None
+            
+            tree = None
+            if "text/html" in response.headers.get("Content-Type", ""):
+                tree = _parse_html(response.content)
+            self._page_cache[key] = tree
+        
+        return self._page_cache[key]
+    
+    def _probe_url(self, url: str) -> Optional[requests.Response]:
+        """Fetch a URL for a probe, returning None if the request fails"""
+        try:
+            return self.session.get(url, timeout=3)
+        except requests.RequestException:
+            return None
     
     def _check_information_exposure(self, base_url: str) -> None:
         """
@@ -1238,51 +2338,45 @@ class WebApplicationScanner:
         Args:
             base_url: Base URL of the web application
         """
-        # Check for common sensitive files
-        sensitive_files = [
-            "/.git/config",
-            "/.env",
-            "/config.php",
-            "/wp-config.php",
-            "/config.js",
-            "/config.yml",
-            "/config.xml",
-            "/credentials.txt",
-            "/database.yml",
-            "/settings.py",
-            "/.htpasswd",
-            "/.bash_history",
-            "/server-status",
-            "/phpinfo.php"
-        ]
-        
+        # Check for common sensitive files, probing them concurrently
         parsed_url = urlparse(base_url)
         base = f"{parsed_url.scheme}://{parsed_url.netloc}"
-        
-        for file_path in sensitive_files:
-            url = f"{base}{file_path}"
-            
-            try:
-                response = requests.get(url, timeout=3, verify=False)
-                
-                if response.status_code == 200:
+        urls = [f"{base}{file_path}" for file_path in self.sensitive_files]
+        
+        # Reuse fresh results from earlier runs; probe only the rest
+        exposed = {}
+        for url in urls:
+            cached = self.parent.cache_get("sensitive_file", url, SENSITIVE_FILE_CACHE_TTL)
+            if cached is not None:
+                exposed[url] = cached
+        pending = [url for url in urls if url not in exposed]
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(WEB_PROBE_WORKERS, len(pending))) as executor:
+                for url, response in zip(pending, executor.map(self._probe_url, pending)):
                     # Check response size to filter out error pages
-                    if len(response.text) > 0:
-                        self.results["issues"].append({
-                            "name": "Sensitive Information Exposure",
-                            "description": f"Sensitive file {file_path} is accessible",
-                            "severity": "high",
-                            "evidence": f"File accessible at {url}",
-                            "url": url,
-                            "remediation": "Restrict access to sensitive files or remove them"
-                        })
-            
-            except requests.RequestException:
-                pass
+                    exposed[url] = (
+                        response is not None and
+                        response.status_code == 200 and
+                        len(response.content) > 0
+                    )
+                    if response is not None:
+                        self.parent.cache_put("sensitive_file", url, exposed[url])
+        
+        for file_path, url in zip(self.sensitive_files, urls):
+            if exposed[url]:
+                self.results["issues"].append({
+                    "name": "Sensitive Information Exposure",
+                    "description": f"Sensitive file {file_path} is accessible",
+                    "severity": "high",
+                    "evidence": f"File accessible at {url}",
+                    "url": url,
+                    "remediation": "Restrict access to sensitive files or remove them"
+                })
         
         # Check for information disclosure in HTTP headers
         try:
-            response = requests.get(base_url, timeout=5, verify=False)
+            response = self.session.get(base_url, timeout=5)
             
             sensitive_headers = {
                 "X-Powered-By": "Technology disclosure",
@@ -1390,7 +2484,6 @@ class PasswordSecurityTester:
         
         # Try anonymous login
         try:
-            import ftplib
             ftp = ftplib.FTP()
             ftp.connect(ip_address, port, timeout=5)
             
@@ -1408,19 +2501,82 @@ class PasswordSecurityTester:
                 # Anonymous login failed, which is good
                 ftp.quit()
                 
-                # In a real implementation, this would test common FTP credentials
-                # For demonstration purposes, we'll simulate the check
-                self.results["issues"].append({
-                    "name": "FTP Password Brute Force Check",
-                    "description": "FTP services should be tested for weak or default credentials",
-                    "severity": "info",
-                    "evidence": "FTP service identified on port " + str(port),
-                    "remediation": "Implement strong password policies for FTP accounts"
-                })
+                credentials = self._find_ftp_credentials(ip_address, port)
+                if credentials:
+                    self.results["issues"].append({
+                        "name": "Default FTP Credentials",
+                        "description": "FTP server accepts a default username and password",
+                        "severity": "high",
+                        "evidence": f"Successfully logged in as {credentials['username']}",
+                        "remediation": "Change default passwords and disable unused FTP accounts"
+                    })
+                else:
+                    self.results["issues"].append({
+                        "name": "FTP Password Brute Force Check",
+                        "description": "FTP services should be tested for weak or default credentials",
+                        "severity": "info",
+                        "evidence": "FTP service identified on port " + str(port),
+                        "remediation": "Implement strong password policies for FTP accounts"
+                    })
             
         except Exception as e:
             logger.debug(f"Error testing FTP passwords: {str(e)}")
     
+    def _find_ftp_credentials(self, ip_address: str, port: int) -> Optional[Dict]:
+        """
+        Try the default credentials against an FTP server concurrently.
+        
+        At most CREDENTIAL_TEST_WORKERS logins are in flight at once, to stay
+        clear of lockout policies, and pending attempts are cancelled after
+        the first success.
+        
+        Args:
+            ip_address: Target IP address
+            port: FTP port number
+            
+        Returns:
+            The first credentials that logged in, or None
+        """
+        cache_key = f"{ip_address}:{port}"
+        cached = self.parent.cache_get("ftp_credentials", cache_key, CREDENTIAL_CACHE_TTL)
+        if cached is not None:
+            return cached["credentials"]
+        
+        def try_login(credentials: Dict) -> Optional[bool]:
+            # True/False for an accepted/refused login, None if it never got an answer
+            try:
+                ftp = ftplib.FTP()
+                ftp.connect(ip_address, port, timeout=5)
+                try:
+                    ftp.login(credentials["username"], credentials["password"])
+                    return True
+                except ftplib.error_perm:
+                    return False
+                finally:
+                    ftp.close()
+            except (OSError, EOFError, ftplib.Error):
+                return None
+        
+        found = None
+        answered = True
+        executor = ThreadPoolExecutor(max_workers=CREDENTIAL_TEST_WORKERS)
+        try:
+            for credentials, success in zip(
+                self.default_credentials,
+                executor.map(try_login, self.default_credentials)
+            ):
+                if success:
+                    found = credentials
+                    break
+                answered = answered and success is not None
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        # A negative result is only cached if every login was actually refused
+        if found or answered:
+            self.parent.cache_put("ftp_credentials", cache_key, {"credentials": found})
+        return found
+    
     def _test_web_passwords(self, port: int, service: str) -> None:
         """
         Test for weak web application passwords.
@@ -1449,6 +2605,25 @@ class PasswordSecurityTester:
                     "remediation": "Implement strong password policies, account lockout, and multi-factor authentication"
                 })
     
+    def _fetch_candidate(self, url: str) -> Optional[bytes]:
+        """
+        Fetch the start of a candidate login page.
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            Up to LOGIN_PAGE_READ bytes of the page, or None if the request
+            failed or did not return an HTML page
+        """
+        try:
+            with self.parent.session.get(url, timeout=5, stream=True) as response:
+                if response.status_code != 200 or "text/html" not in response.headers.get("Content-Type", ""):
+                    return None
+                return response.raw.read(LOGIN_PAGE_READ, decode_content=True)
+        except (requests.RequestException, URLLib3Error):
+            return None
+    
     def _find_login_forms(self, base_url: str) -> List[str]:
         """
         Find login forms on the website.
@@ -1467,39 +2642,22 @@ class PasswordSecurityTester:
             "/cp", "/portal", "/dashboard", "/backend"
         ]
         
-        for path in crawl_paths:
-            url = f"{base_url.rstrip('/')}{path}"
+        urls = [f"{base_url.rstrip('/')}{path}" for path in crawl_paths]
+        
+        # Fetch the candidate pages concurrently; they come back in path order
+        with ThreadPoolExecutor(max_workers=WEB_PROBE_WORKERS) as executor:
+            pages = list(executor.map(self._fetch_candidate, urls))
+        
+        for url, raw in zip(urls, pages):
+            # A login form needs a password field, so only parse pages that have one
+            if raw is None or not PASSWORD_INPUT_PATTERN.search(raw):
+                continue
             
-            try:
-                response = requests.get(url, timeout=5, verify=False)
-                
-                if response.status_code == 200 and "text/html" in response.headers.get("Content-Type", ""):
-                    content = response.text.lower()
-                    
-                    # Check if this looks like a login page
-                    login_indicators = [
-                        "login", "log in", "sign in", "signin", "username", "password",
-                        "user name", "email", "authentication", "auth", "credentials"
-                    ]
-                    
-                    if any(indicator in content for indicator in login_indicators):
-                        # Check for form elements
-                        soup = BeautifulSoup(response.text, "html.parser")
-                        forms = soup.find_all("form")
-                        
-                        for form in forms:
-                            # Check if form has password field
-                            has_password = any(
-                                input_tag.get("type") == "password" 
-                                for input_tag in form.find_all("input")
-                            )
-                            
-                            if has_password:
-                                login_urls.append(url)
-                                break
+            soup = BeautifulSoup(raw, "lxml", parse_only=FORMS_ONLY)
             
-            except requests.RequestException:
-                pass
+            # Only form subtrees were parsed, so any password input is in a form
+            if soup.select_one('input[type="password"]') is not None:
+                login_urls.append(url)
         
         return login_urls
 
@@ -1522,18 +2680,33 @@ class ReportGenerator:
         output_dir = self.parent.output_dir
         target = self.parent.target
         
-        # Generate JSON report
-        json_file = os.path.join(output_dir, f"pentest_{target}_{int(time.time())}.json")
-        with open(json_file, "w") as f:
-            json.dump(self.results, f, indent=2)
+        # One timestamp so both reports of a run share a file name stem
+        stem = os.path.join(output_dir, f"pentest_{target}_{int(time.time())}")
         
-        logger.info(f"JSON report saved to {json_file}")
+        json_file = f"{stem}.json"
+        html_file = f"{stem}.html"
         
-        # Generate HTML report
-        html_file = os.path.join(output_dir, f"pentest_{target}_{int(time.time())}.html")
-        self._generate_html_report(html_file)
+        # Write both reports at once; file writes release the GIL, so the JSON
+        # write overlaps the HTML rendering
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            json_future = executor.submit(self._generate_json_report, json_file)
+            html_future = executor.submit(self._generate_html_report, html_file)
+            
+            json_future.result()
+            logger.info(f"JSON report saved to {json_file}")
+            
+            html_future.result()
+            logger.info(f"HTML report saved to {html_file}")
+    
+    def _generate_json_report(self, filename: str) -> None:
+        """
+        Generate a JSON report.
         
-        logger.info(f"HTML report saved to {html_file}")
+        Args:
+            filename: Output filename
+        """
+        with open(filename, "wb") as f:
+            f.write(_dumpb(self.results))
     
     def _generate_html_report(self, filename: str) -> None:
         """
@@ -1542,78 +2715,44 @@ class ReportGenerator:
         Args:
             filename: Output filename
         """
-        # Create a basic HTML report
-        target = self.results["metadata"]["target"]
-        start_time = self.results["metadata"]["start_time"]
-        finish_time = self.results["metadata"].get("finish_time", "N/A")
-        
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Penetration Test Report: {target}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; color: #333; }}
-        h1, h2, h3, h4 {{ color: #2c3e50; }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        .header {{ background-color: #34495e; color: white; padding: 20px; margin-bottom: 20px; }}
-        .section {{ margin-bottom: 30px; border: 1px solid #ddd; padding: 20px; border-radius: 5px; }}
-        .footer {{ margin-top: 50px; border-top: 1px solid #ddd; padding-top: 20px; text-align: center; }}
-        table {{ width: 100%; border-collapse: collapse; margin-bottom: 20px; }}
-        th, td {{ padding: 12px 15px; border-bottom: 1px solid #ddd; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-        tr:hover {{ background-color: #f5f5f5; }}
-        .severity-critical {{ color: #fff; background-color: #e74c3c; padding: 5px 10px; border-radius: 3px; }}
-        .severity-high {{ color: #fff; background-color: #e67e22; padding: 5px 10px; border-radius: 3px; }}
-        .severity-medium {{ color: #fff; background-color: #f39c12; padding: 5px 10px; border-radius: 3px; }}
-        .severity-low {{ color: #fff; background-color: #3498db; padding: 5px 10px; border-radius: 3px; }}
-        .severity-info {{ color: #fff; background-color: #2ecc71; padding: 5px 10px; border-radius: 3px; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Penetration Test Report</h1>
-            <p>Target: {target}</p>
-            <p>Start Time: {start_time}</p>
-            <p>Finish Time: {finish_time}</p>
-        </div>
+        # Create a basic HTML report; scanned hosts control much of the text, so
+        # every value is escaped before it is embedded
+        target = _escape_html(self.results["metadata"]["target"])
+        start_time = _escape_html(self.results["metadata"]["start_time"])
+        finish_time = _escape_html(self.results["metadata"].get("finish_time", "N/A"))
         
-        <div class="section">
-            <h2>Executive Summary</h2>
-            <p>This report presents the findings of a penetration test conducted against {target}.</p>
+        # Write fragments straight to the file rather than building the document in memory
+        with open(filename, "w") as f:
+            w = f.write
             
-            <h3>Key Findings</h3>
-            <ul>
-"""
-        
-        # Summary counts
-        summary = self.results.get("summary", {})
-        vuln_counts = summary.get("vulnerabilities", {})
-        
-        if vuln_counts.get("critical", 0) > 0:
-            html += f"<li><strong>{vuln_counts['critical']}</strong> critical vulnerabilities</li>\n"
-        if vuln_counts.get("high", 0) > 0:
-            html += f"<li><strong>{vuln_counts['high']}</strong> high severity vulnerabilities</li>\n"
-        if vuln_counts.get("medium", 0) > 0:
-            html += f"<li><strong>{vuln_counts['medium']}</strong> medium severity vulnerabilities</li>\n"
-        if vuln_counts.get("low", 0) > 0:
-            html += f"<li><strong>{vuln_counts['low']}</strong> low severity vulnerabilities</li>\n"
-        if vuln_counts.get("info", 0) > 0:
-            html += f"<li><strong>{vuln_counts['info']}</strong> informational findings</li>\n"
-        
-        html += f"""            </ul>
+            w(REPORT_HEAD.format(target))
+            w(REPORT_STYLE)
+            w(REPORT_HEADER.format(
+                target=target, start_time=start_time, finish_time=finish_time
+            ))
+            
+            # Summary counts
+            summary = self.results.get("summary", {})
+            vuln_counts = summary.get("vulnerabilities", {})
+            
+            for severity, label in SEVERITY_LABELS.items():
+                count = vuln_counts.get(severity, 0)
+                if count > 0:
+                    w(f"<li><strong>{count}</strong> {label}</li>\n")
+            
+            w(f"""            </ul>
         </div>
         
         <div class="section">
             <h2>Network Scan Results</h2>
-"""
-        
-        # Network results
-        network = self.results.get("network", {})
-        ip_address = network.get("ip_address", "N/A")
-        hostname = network.get("hostname", "N/A")
-        
-        html += f"""            <p><strong>IP Address:</strong> {ip_address}</p>
+""")
+            
+            # Network results
+            network = self.results.get("network", {})
+            ip_address = _escape_html(network.get("ip_address", "N/A"))
+            hostname = _escape_html(network.get("hostname", "N/A"))
+            
+            w(f"""            <p><strong>IP Address:</strong> {ip_address}</p>
             <p><strong>Hostname:</strong> {hostname}</p>
             
             <h3>Open Ports</h3>
@@ -1624,110 +2763,35 @@ class ReportGenerator:
                     <th>Service</th>
                     <th>State</th>
                 </tr>
-"""
-        
-        for port in network.get("open_ports", []):
-            html += f"""                <tr>
-                    <td>{port.get('port', 'N/A')}</td>
-                    <td>{port.get('protocol', 'N/A')}</td>
-                    <td>{port.get('service', 'N/A')}</td>
-                    <td>{port.get('state', 'N/A')}</td>
-                </tr>
-"""
-        
-        html += """            </table>
-        </div>
-        
-        <div class="section">
-            <h2>Vulnerabilities</h2>
-            <table>
-                <tr>
-                    <th>Name</th>
-                    <th>Severity</th>
-                    <th>Description</th>
-                    <th>Remediation</th>
-                </tr>
-"""
-        
-        # Vulnerabilities
-        vulnerabilities = self.results.get("vulnerabilities", [])
-        for vuln in vulnerabilities:
-            severity = vuln.get("severity", "info").lower()
-            html += f"""                <tr>
-                    <td>{vuln.get('name', 'N/A')}</td>
-                    <td><span class="severity-{severity}">{severity.upper()}</span></td>
-                    <td>{vuln.get('description', 'N/A')}</td>
-                    <td>{vuln.get('remediation', 'N/A')}</td>
-                </tr>
-"""
-        
-        html += """            </table>
-        </div>
-        
-        <div class="section">
-            <h2>Web Application Issues</h2>
-            <table>
-                <tr>
-                    <th>Name</th>
-                    <th>Severity</th>
-                    <th>Description</th>
-                    <th>Remediation</th>
-                </tr>
-"""
-        
-        # Web issues
-        web = self.results.get("web", {})
-        for issue in web.get("issues", []):
-            severity = issue.get("severity", "info").lower()
-            html += f"""                <tr>
-                    <td>{issue.get('name', 'N/A')}</td>
-                    <td><span class="severity-{severity}">{severity.upper()}</span></td>
-                    <td>{issue.get('description', 'N/A')}</td>
-                    <td>{issue.get('remediation', 'N/A')}</td>
-                </tr>
-"""
-        
-        html += """            </table>
-        </div>
-        
-        <div class="section">
-            <h2>Password Security Issues</h2>
-            <table>
-                <tr>
-                    <th>Name</th>
-                    <th>Severity</th>
-                    <th>Description</th>
-                    <th>Remediation</th>
-                </tr>
-"""
-        
-        # Password issues
-        password = self.results.get("password", {})
-        for issue in password.get("issues", []):
-            severity = issue.get("severity", "info").lower()
-            html += f"""                <tr>
-                    <td>{issue.get('name', 'N/A')}</td>
-                    <td><span class="severity-{severity}">{severity.upper()}</span></td>
-                    <td>{issue.get('description', 'N/A')}</td>
-                    <td>{issue.get('remediation', 'N/A')}</td>
-                </tr>
-"""
-        
-        html += """            </table>
-        </div>
-        
-        <div class="footer">
-            <p>This report was generated by the Python Penetration Testing Framework</p>
-            <p>For educational and authorized security testing purposes only</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
-        
-        # Write HTML to file
-        with open(filename, "w") as f:
-            f.write(html)
+""")
+            
+            for port in network.get("open_ports", []):
+                w(PORT_ROW.format(
+                    _escape_html(port.get("port", "N/A")),
+                    _escape_html(port.get("protocol", "N/A")),
+                    _escape_html(port.get("service", "N/A")),
+                    _escape_html(port.get("state", "N/A"))
+                ))
+            
+            w(TABLE_END)
+            
+            # Findings tables; a section with nothing to list gets a short note
+            finding_sections = (
+                ("Vulnerabilities", self.results.get("vulnerabilities")),
+                ("Web Application Issues", self.results.get("web", {}).get("issues")),
+                ("Password Security Issues", self.results.get("password", {}).get("issues"))
+            )
+            for title, issues in finding_sections:
+                if not issues:
+                    w(EMPTY_SECTION.format(title))
+                    continue
+                
+                w(ISSUE_TABLE_START.format(title))
+                for issue in issues:
+                    w(_issue_row(issue))
+                w(TABLE_END)
+            
+            w(REPORT_FOOTER)
 
 
 def main():
@@ -1737,15 +2801,23 @@ def main():
     parser.add_argument("-o", "--output", default="results", help="Output directory for reports")
     parser.add_argument("-v", "--verbosity", type=int, choices=[1, 2, 3], default=1, 
                        help="Verbosity level (1-3)")
+    parser.add_argument("--scan-level", choices=list(SCAN_LEVELS), default="full",
+                       help="Web scan thoroughness: fewer payloads and files at faster levels")
+    parser.add_argument("--cache", nargs="?", const=SCAN_CACHE_PATH, default=None,
+                       metavar="PATH",
+                       help=f"Reuse fresh results from earlier runs (default file: {SCAN_CACHE_PATH})")
+    parser.add_argument("--max-concurrent", type=int, default=None, metavar="N",
+                       help="Maximum HTTP requests in flight at once")
+    parser.add_argument("--max-rps", type=float, default=None, metavar="RATE",
+                       help="Maximum HTTP requests per second sent to the target")
     
     args = parser.parse_args()
     
-    # Suppress InsecureRequestWarning for HTTPS connections
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    
     # Create and run the penetration test
-    pentest = PenetrationTest(args.target, args.output, args.verbosity)
+    pentest = PenetrationTest(
+        args.target, args.output, args.verbosity, args.scan_level, args.cache,
+        args.max_concurrent, args.max_rps
+    )
     results = pentest.run_full_scan()
     
     logger.info(f"Penetration test completed. Results saved to {args.output} directory.")
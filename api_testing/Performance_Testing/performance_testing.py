@@ -13,21 +13,21 @@ import cProfile
 import pstats
 import io
 import gc
-import statistics
+import tracemalloc
 import os
 import psutil
 import multiprocessing
 import threading
-import concurrent.futures
+import queue
 import requests
 import random
 import logging
 import json
-from functools import wraps
+from functools import partial, wraps
 from typing import Callable, List, Dict, Any, Union, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
 
 # Configure logging
@@ -40,38 +40,100 @@ logger = logging.getLogger(__name__)
 
 # ===== DECORATORS FOR TIMING AND BENCHMARKING =====
 
+def _time_stats(times) -> Dict[str, float]:
+    """Compute mean, min, max and sample standard deviation of timings with NumPy."""
+    arr = np.asarray(times, dtype=np.float64)
+    return {
+        'avg_time': float(arr.mean()),
+        'min_time': float(arr.min()),
+        'max_time': float(arr.max()),
+        'std_dev': float(arr.std(ddof=1)) if arr.size > 1 else 0
+    }
+
+
 def timer_decorator(func):
     """Decorator that measures and logs execution time of functions."""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        execution_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        execution_time = (end_time - start_time) / 1e9
         logger.info(f"Function {func.__name__} executed in {execution_time:.6f} seconds")
         return result
     return wrapper
 
 
-def benchmark_decorator(repeat=5):
-    """Decorator that benchmarks a function by running it multiple times."""
+def benchmark_decorator(repeat=5, warmup=0):
+    """Decorator that benchmarks a function by running it multiple times.
+    
+    ``warmup`` untimed calls are made first, e.g. so JIT-compiled (Numba)
+    functions are not timed while compiling.
+    
+    On Linux the timed loop runs pinned to a single CPU. Threads the
+    benchmarked function starts inherit that affinity, so multi-threaded
+    workloads are serialised onto one core and time accordingly.
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            times = []
-            for _ in range(repeat):
-                start_time = time.time()
-                result = func(*args, **kwargs)
-                end_time = time.time()
-                times.append(end_time - start_time)
+            for _ in range(warmup):
+                func(*args, **kwargs)
             
-            avg_time = statistics.mean(times)
-            min_time = min(times)
-            max_time = max(times)
-            std_dev = statistics.stdev(times) if len(times) > 1 else 0
+            # Welford's online mean/variance: O(1) memory however large
+            # ``repeat`` is, since only the summary is logged
+            clock = time.perf_counter_ns
+            n = 0
+            mean = m2 = 0.0
+            min_time = float('inf')
+            max_time = float('-inf')
+            
+            # Pin the thread to one core so it is not migrated onto a cold
+            # cache mid-run (Linux only), and keep the garbage collector from
+            # adding pauses to individual timings. Garbage is instead
+            # collected between calls, outside the timed region: with
+            # automatic collection off, everything a call allocated is still
+            # in the youngest generation, so collecting just that one frees
+            # any reference cycles it left behind.
+            affinity = None
+            if hasattr(os, 'sched_setaffinity'):
+                affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, {min(affinity)})
+            gc_was_enabled = gc.isenabled()
+            gc.collect()
+            gc.disable()
+            try:
+                for _ in range(repeat):
+                    start_time = clock()
+                    result = func(*args, **kwargs)
+                    end_time = clock()
+                    if gc_was_enabled:
+                        gc.collect(0)
+                    t = (end_time - start_time) / 1e9
+                    n += 1
+                    delta = t - mean
+                    mean += delta / n
+                    m2 += delta * (t - mean)
+                    if t < min_time:
+                        min_time = t
+                    if t > max_time:
+                        max_time = t
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+                if affinity is not None:
+                    os.sched_setaffinity(0, affinity)
+            
+            stats = {
+                'avg_time': mean,
+                'min_time': min_time,
+                'max_time': max_time,
+                'std_dev': (m2 / (n - 1)) ** 0.5 if n > 1 else 0
+            }
             
             logger.info(f"Benchmark results for {func.__name__}:")
-            logger.info(f"  Avg: {avg_time:.6f}s, Min: {min_time:.6f}s, Max: {max_time:.6f}s, StdDev: {std_dev:.6f}s")
+            logger.info(f"  Avg: {stats['avg_time']:.6f}s, Min: {stats['min_time']:.6f}s, "
+                        f"Max: {stats['max_time']:.6f}s, StdDev: {stats['std_dev']:.6f}s")
             
             return result
         return wrapper
@@ -89,49 +151,64 @@ class MemoryStats:
     diff_memory_mb: float
 
 
+# psutil handle for this process, created on first use and again after a fork
+_process = None
+
+
+def _current_process() -> psutil.Process:
+    """Return a cached psutil.Process for the current process."""
+    global _process
+    if _process is None or _process.pid != os.getpid():
+        _process = psutil.Process()
+    return _process
+
+
 def get_process_memory() -> float:
     """Get the current memory usage of the process in MB."""
-    process = psutil.Process(os.getpid())
-    memory_info = process.memory_info()
+    memory_info = _current_process().memory_info()
     return memory_info.rss / (1024 * 1024)  # Convert to MB
 
 
 def memory_usage_decorator(func):
-    """Decorator that monitors memory usage of a function."""
+    """Decorator that monitors memory usage of a function.
+    
+    Peak usage is measured with tracemalloc. If the caller is already
+    tracing, tracing is left running, but its recorded peak is reset to the
+    peak of this call; the earlier peak is logged when it was the higher one.
+    """
     @wraps(func)
     def wrapper(*args, **kwargs):
         # Clear garbage collector to get accurate memory reading
         gc.collect()
         initial_memory = get_process_memory()
         
-        # Track peak memory during execution
-        peak_memory = initial_memory
-        
-        def memory_monitor():
-            nonlocal peak_memory
-            monitoring = True
-            while monitoring:
-                current = get_process_memory()
-                peak_memory = max(peak_memory, current)
-                time.sleep(0.001)  # Small sleep to reduce CPU usage
-                if not monitoring:
-                    break
-        
-        # Start memory monitoring in a separate thread
-        monitor_thread = threading.Thread(target=memory_monitor)
-        monitor_thread.daemon = True
-        monitor_thread.start()
+        # Track peak memory during execution with tracemalloc, which records
+        # the peak inside the allocator instead of sampling from a thread
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        baseline_traced, outer_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
         
         try:
             result = func(*args, **kwargs)
         finally:
-            # Stop monitoring thread
-            monitor_thread.monitoring = False
-            monitor_thread.join(timeout=1.0)
-            
             # Collect garbage before final measurement
             gc.collect()
-            final_memory = get_process_memory()
+            final_traced, peak_traced = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+        
+        # Peak and final usage are the starting RSS plus the memory allocated
+        # at the peak and still held at the end. RSS is not re-read because
+        # tracemalloc's own bookkeeping fragments the heap and keeps freed
+        # pages resident.
+        peak_memory = initial_memory + (peak_traced - baseline_traced) / (1024 * 1024)
+        final_memory = initial_memory + (final_traced - baseline_traced) / (1024 * 1024)
+        
+        if not started_tracing and outer_peak > peak_traced:
+            logger.info(f"tracemalloc peak of {outer_peak / (1024 * 1024):.2f} MB traced "
+                        f"before {func.__name__} was reset")
         
         memory_stats = MemoryStats(
             peak_memory_mb=peak_memory,
@@ -187,13 +264,19 @@ def detailed_profile(func, *args, **kwargs) -> Dict[str, Any]:
         **kwargs: Keyword arguments to pass to the function
         
     Returns:
-        Dict containing profile results
+        Dict containing profile results; "profile_path" names the binary
+        .prof file holding the full profile
     """
     # Clear any cached data and collect garbage
     gc.collect()
     
+    # Prime the CPU counter so the reading taken afterwards covers exactly
+    # the profiled call, without blocking on a sampling interval
+    process = _current_process()
+    process.cpu_percent(interval=None)
+    
     # Time measurement
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     
     # Use cProfile for detailed analysis
     profiler = cProfile.Profile()
@@ -201,28 +284,26 @@ def detailed_profile(func, *args, **kwargs) -> Dict[str, Any]:
     result = func(*args, **kwargs)
     profiler.disable()
     
-    execution_time = time.time() - start_time
+    execution_time = (time.perf_counter_ns() - start_time) / 1e9
+    cpu_percent = process.cpu_percent(interval=None)
     
-    # Extract profiling data
-    s = io.StringIO()
-    ps = pstats.Stats(profiler, stream=s).sort_stats('cumulative')
-    ps.print_stats(20)  # Top 20 time-consuming functions
+    # Keep the full call graph in pstats' binary format instead of a
+    # formatted text excerpt; load it later with pstats.Stats(profile_path)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    profile_path = f"profile_{func.__name__}_{timestamp}.prof"
+    profiler.dump_stats(profile_path)
     
     # Process memory
-    process = psutil.Process(os.getpid())
     memory_info = process.memory_info()
     memory_mb = memory_info.rss / (1024 * 1024)
     
-    # CPU usage
-    cpu_percent = process.cpu_percent(interval=0.1)
-    
     # Create structured results
     profile_results = {
         "function_name": func.__name__,
         "execution_time": execution_time,
         "memory_usage_mb": memory_mb,
         "cpu_percent": cpu_percent,
-        "profile_details": s.getvalue(),
+        "profile_path": profile_path,
         "timestamp": datetime.now().isoformat()
     }
     
@@ -233,6 +314,9 @@ def save_profile_results(profile_data: Dict[str, Any], filename: str = None) ->
     """
     Save profile results to a file and return the filename.
     
+    The call graph itself is already on disk at ``profile_data['profile_path']``,
+    so only the scalar fields are written here.
+    
     Args:
         profile_data: Profile data dictionary
         filename: Optional filename to save to
@@ -244,12 +328,8 @@ def save_profile_results(profile_data: Dict[str, Any], filename: str = None) ->
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"profile_{profile_data['function_name']}_{timestamp}.json"
     
-    # Create a version of the profile data that's JSON serializable
-    serializable_data = profile_data.copy()
-    serializable_data['timestamp'] = str(serializable_data['timestamp'])
-    
     with open(filename, 'w') as f:
-        json.dump(serializable_data, f, indent=2)
+        json.dump(profile_data, f, indent=2)
     
     logger.info(f"Profile results saved to {filename}")
     return filename
@@ -258,7 +338,8 @@ def save_profile_results(profile_data: Dict[str, Any], filename: str = None) ->
 # ===== BENCHMARKING UTILITIES =====
 
 def benchmark_comparison(funcs: List[Callable], args_list: List[tuple] = None, 
-                          kwargs_list: List[dict] = None, iterations: int = 5) -> Dict[str, Dict]:
+                          kwargs_list: List[dict] = None, iterations: int = 5,
+                          warmup: int = 0) -> Dict[str, Dict]:
     """
     Compare performance of multiple functions.
     
@@ -267,6 +348,8 @@ def benchmark_comparison(funcs: List[Callable], args_list: List[tuple] = None,
         args_list: List of args tuples for each function (or None for empty args)
         kwargs_list: List of kwargs dicts for each function (or None for empty kwargs)
         iterations: Number of iterations for each function
+        warmup: Untimed calls made first, e.g. to exclude the compilation of
+            JIT-compiled (Numba) functions from the timings
         
     Returns:
         Dictionary with benchmark results
@@ -278,24 +361,21 @@ def benchmark_comparison(funcs: List[Callable], args_list: List[tuple] = None,
     
     results = {}
     
+    clock = time.perf_counter_ns
+    
     for idx, (func, args, kwargs) in enumerate(zip(funcs, args_list, kwargs_list)):
+        for _ in range(warmup):
+            func(*args, **kwargs)
+        
         times = []
         for _ in range(iterations):
-            start_time = time.time()
+            start_time = clock()
             func(*args, **kwargs)
-            end_time = time.time()
-            times.append(end_time - start_time)
-        
-        avg_time = statistics.mean(times)
-        min_time = min(times)
-        max_time = max(times)
-        std_dev = statistics.stdev(times) if len(times) > 1 else 0
+            end_time = clock()
+            times.append((end_time - start_time) / 1e9)
         
         results[func.__name__] = {
-            'avg_time': avg_time,
-            'min_time': min_time,
-            'max_time': max_time,
-            'std_dev': std_dev,
+            **_time_stats(times),
             'all_times': times
         }
     
@@ -319,18 +399,12 @@ def timeit_benchmark(code_snippet: str, setup: str = "pass",
     times = timeit.repeat(code_snippet, setup=setup, number=number, repeat=repeat)
     
     # Calculate statistics
-    avg_time = statistics.mean(times)
-    min_time = min(times)
-    max_time = max(times)
-    std_dev = statistics.stdev(times) if repeat > 1 else 0
+    stats = _time_stats(times)
     
     results = {
-        'avg_time': avg_time,
-        'min_time': min_time,
-        'max_time': max_time,
-        'std_dev': std_dev,
+        **stats,
         'all_times': times,
-        'per_iteration': min_time / number
+        'per_iteration': stats['min_time'] / number
     }
     
     return results
@@ -347,29 +421,31 @@ def visualize_benchmark_results(results: Dict[str, Dict], title: str = "Performa
     function_names = list(results.keys())
     avg_times = [results[func]['avg_time'] for func in function_names]
     
-    # Create figure
-    plt.figure(figsize=(10, 6))
-    bars = plt.bar(function_names, avg_times)
+    # Create figure; a standalone Figure renders with Agg and needs no GUI
+    fig = Figure(figsize=(10, 6))
+    ax = fig.add_subplot()
+    bars = ax.bar(function_names, avg_times)
     
     # Add error bars for standard deviation
     std_devs = [results[func]['std_dev'] for func in function_names]
-    plt.errorbar(function_names, avg_times, yerr=std_devs, fmt='none', ecolor='black', capsize=5)
+    ax.errorbar(function_names, avg_times, yerr=std_devs, fmt='none', ecolor='black', capsize=5)
     
     # Add labels and formatting
-    plt.title(title)
-    plt.xlabel('Function')
-    plt.ylabel('Average Execution Time (s)')
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
+    ax.set_title(title)
+    ax.set_xlabel('Function')
+    ax.set_ylabel('Average Execution Time (s)')
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
+    fig.tight_layout()
     
     # Add values on top of bars
     for bar, time_val in zip(bars, avg_times):
-        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.002, 
+        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.002, 
                  f'{time_val:.6f}s', ha='center', va='bottom', fontsize=8)
     
-    # Save and show
-    plt.savefig(f"{title.replace(' ', '_')}.png")
-    plt.show()
+    # Save
+    fig.savefig(f"{title.replace(' ', '_')}.png")
 
 
 # ===== LOAD AND STRESS TESTING =====
@@ -377,6 +453,9 @@ def visualize_benchmark_results(results: Dict[str, Dict], title: str = "Performa
 class LoadTester:
     """Class for performing HTTP-based load testing."""
     
+    # Methods whose data is sent as a JSON request body
+    JSON_BODY_METHODS = ("POST", "PUT")
+    
     def __init__(self, base_url: str, max_workers: int = 10, timeout: int = 30):
         """
         Initialize the load tester.
@@ -391,6 +470,66 @@ class LoadTester:
         self.timeout = timeout
         self.results = []
         self.session = requests.Session()
+        self._pool_size = 0
+        self._ensure_pool(max_workers)
+        
+        # Request senders by HTTP method: (url, data, headers) -> response.
+        # Bodies are streamed so single_request can count them chunk by
+        # chunk without holding a full copy in memory
+        session = self.session
+        self._dispatch = {
+            "GET": lambda url, data, headers: session.get(
+                url, params=data, headers=headers, timeout=self.timeout, stream=True),
+            "POST": lambda url, data, headers: session.post(
+                url, data=data, headers=headers, timeout=self.timeout, stream=True),
+            "PUT": lambda url, data, headers: session.put(
+                url, data=data, headers=headers, timeout=self.timeout, stream=True),
+            "DELETE": lambda url, data, headers: session.delete(
+                url, headers=headers, timeout=self.timeout, stream=True)
+        }
+        
+        # Full URLs by (base URL, endpoint), reused across requests and tests
+        self._urls = {}
+    
+    def _ensure_pool(self, workers: int) -> None:
+        """
+        Make sure the session keeps at least one connection per worker alive.
+        
+        requests keeps only 10 connections per host by default; with more
+        workers than that, extra connections are opened and thrown away on
+        every request, so the test ends up timing TCP/TLS handshakes instead
+        of the server. Growing the pool means replacing the adapter, which
+        closes the connections it held, so callers that know their peak
+        worker count (stress_test) size the pool for it up front.
+        
+        Args:
+            workers: Number of threads that will share the session
+        """
+        if workers <= self._pool_size:
+            return
+        replaced = self.session.adapters.get("http://") if self._pool_size else None
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=workers, pool_maxsize=workers, pool_block=True
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if replaced is not None:
+            replaced.close()
+        self._pool_size = workers
+    
+    @staticmethod
+    def _json_body(data: Dict, headers: Dict) -> Tuple[bytes, Dict]:
+        """Encode data as a JSON body the way requests' json= does, plus its headers."""
+        body = json.dumps(data, allow_nan=False).encode('utf-8')
+        return body, {'Content-Type': 'application/json', **headers}
+    
+    def _endpoint_url(self, endpoint: str) -> str:
+        """Return the full URL for an endpoint, building it only once."""
+        key = (self.base_url, endpoint)
+        url = self._urls.get(key)
+        if url is None:
+            url = self._urls[key] = f"{self.base_url}/{endpoint}".rstrip('/')
+        return url
     
     def single_request(self, endpoint: str = "", method: str = "GET", 
                        data: Dict = None, headers: Dict = None) -> Dict:
@@ -400,32 +539,36 @@ class LoadTester:
         Args:
             endpoint: API endpoint to call
             method: HTTP method to use
-            data: Data to send with the request
+            data: Data to send with the request; for POST/PUT this may
+                also be an already encoded JSON body, which is sent as is
             headers: Headers to include
             
         Returns:
-            Dictionary with request results
+            Dictionary with request results; "timestamp_ns" is the wall-clock
+            completion time in nanoseconds since the epoch
         """
-        url = f"{self.base_url}/{endpoint}".rstrip('/')
+        url = self._endpoint_url(endpoint)
         headers = headers or {}
         data = data or {}
+        if method.upper() in self.JSON_BODY_METHODS and not isinstance(data, bytes):
+            data, headers = self._json_body(data, headers)
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            if method.upper() == "GET":
-                response = self.session.get(url, params=data, headers=headers, timeout=self.timeout)
-            elif method.upper() == "POST":
-                response = self.session.post(url, json=data, headers=headers, timeout=self.timeout)
-            elif method.upper() == "PUT":
-                response = self.session.put(url, json=data, headers=headers, timeout=self.timeout)
-            elif method.upper() == "DELETE":
-                response = self.session.delete(url, headers=headers, timeout=self.timeout)
-            else:
+            send = self._dispatch.get(method.upper())
+            if send is None:
                 raise ValueError(f"Unsupported HTTP method: {method}")
+            response = send(url, data, headers)
+            
+            # Read the body through to the end (so the connection goes back
+            # to the pool) and keep only its decoded size
+            content_size = 0
+            for chunk in response.iter_content(65536):
+                content_size += len(chunk)
             
-            end_time = time.time()
-            response_time = end_time - start_time
+            end_time = time.perf_counter_ns()
+            response_time = (end_time - start_time) / 1e9
             
             result = {
                 "url": url,
@@ -433,13 +576,13 @@ class LoadTester:
                 "status_code": response.status_code,
                 "response_time": response_time,
                 "success": 200 <= response.status_code < 400,
-                "content_size": len(response.content),
-                "timestamp": datetime.now().isoformat()
+                "content_size": content_size,
+                "timestamp_ns": time.time_ns()
             }
             
         except Exception as e:
-            end_time = time.time()
-            response_time = end_time - start_time
+            end_time = time.perf_counter_ns()
+            response_time = (end_time - start_time) / 1e9
             
             result = {
                 "url": url,
@@ -447,11 +590,46 @@ class LoadTester:
                 "error": str(e),
                 "response_time": response_time,
                 "success": False,
-                "timestamp": datetime.now().isoformat()
+                "timestamp_ns": time.time_ns()
             }
         
         return result
     
+    @staticmethod
+    def _run_requests(request: Callable[[], Dict], indices: range, workers: int,
+                      record: Callable[[int, Dict], None]) -> None:
+        """
+        Send one request per index from a fixed set of worker threads.
+        
+        Indices are handed out through a queue bounded to twice the worker
+        count, so scheduling overhead stays constant however many requests
+        are sent, unlike submitting a future per request up front.
+        
+        Args:
+            request: Callable that sends a single request and returns its result
+            indices: Result slots to fill, one request each
+            workers: Number of concurrent worker threads
+            record: Called with (index, result) for every completed request
+        """
+        work = queue.Queue(maxsize=workers * 2)
+        
+        def worker():
+            while True:
+                idx = work.get()
+                if idx is None:
+                    break
+                record(idx, request())
+        
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for idx in indices:
+            work.put(idx)
+        for _ in threads:
+            work.put(None)
+        for thread in threads:
+            thread.join()
+    
     def load_test(self, endpoint: str = "", num_requests: int = 100, 
                   method: str = "GET", data: Dict = None, 
                   headers: Dict = None, ramp_up: bool = False) -> Dict:
@@ -469,10 +647,28 @@ class LoadTester:
         Returns:
             Dictionary with test results
         """
-        self.results = []
+        self.results = [None] * num_requests
         headers = headers or {}
         data = data or {}
         
+        # Per-request columns filled in as results arrive, so the statistics
+        # read preallocated arrays instead of walking the result dicts
+        response_times = np.empty(num_requests, dtype=np.float64)
+        succeeded = np.zeros(num_requests, dtype=bool)
+        
+        def record(idx, result):
+            response_times[idx] = result['response_time']
+            succeeded[idx] = result.get('success', False)
+            self.results[idx] = result
+        
+        # Every request sends the same payload, so encode a JSON body once
+        # rather than once per request
+        if method.upper() in self.JSON_BODY_METHODS:
+            data, headers = self._json_body(data, headers)
+        
+        request = partial(self.single_request, endpoint, method, data, headers)
+        self._ensure_pool(self.max_workers)
+        
         # Determine the number of workers based on ramp_up setting
         if ramp_up:
             # Start with 1 worker and gradually increase
@@ -483,25 +679,24 @@ class LoadTester:
             # Use fixed number of workers
             workers = min(self.max_workers, num_requests)
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         if ramp_up:
             # Execute with gradually increasing concurrency
             for i in range(worker_groups):
                 current_workers = max(1, (i + 1) * self.max_workers // worker_groups)
-                current_requests = min(remaining, requests_per_group)
+                # The last phase also takes the division remainder, so every
+                # preallocated result slot gets filled
+                if i == worker_groups - 1:
+                    current_requests = remaining
+                else:
+                    current_requests = min(remaining, requests_per_group)
                 
                 logger.info(f"Ramp-up phase {i+1}/{worker_groups}: {current_workers} workers, {current_requests} requests")
                 
-                with concurrent.futures.ThreadPoolExecutor(max_workers=current_workers) as executor:
-                    future_to_url = {
-                        executor.submit(self.single_request, endpoint, method, data, headers): i 
-                        for i in range(current_requests)
-                    }
-                    
-                    for future in concurrent.futures.as_completed(future_to_url):
-                        result = future.result()
-                        self.results.append(result)
+                first = num_requests - remaining
+                self._run_requests(request, range(first, first + current_requests),
+                                   current_workers, record)
                 
                 remaining -= current_requests
                 
@@ -510,44 +705,38 @@ class LoadTester:
                     time.sleep(1.0)
         else:
             # Execute all requests with fixed concurrency
-            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-                future_to_url = {
-                    executor.submit(self.single_request, endpoint, method, data, headers): i 
-                    for i in range(num_requests)
-                }
-                
-                for future in concurrent.futures.as_completed(future_to_url):
-                    result = future.result()
-                    self.results.append(result)
+            self._run_requests(request, range(num_requests), workers, record)
         
-        end_time = time.time()
-        total_time = end_time - start_time
+        end_time = time.perf_counter_ns()
+        total_time = (end_time - start_time) / 1e9
         
         # Calculate statistics
-        successful_requests = sum(1 for r in self.results if r.get('success', False))
+        successful_requests = int(np.count_nonzero(succeeded))
         failed_requests = num_requests - successful_requests
         
         if successful_requests > 0:
-            response_times = [r['response_time'] for r in self.results if r.get('success', False)]
-            avg_response_time = statistics.mean(response_times)
-            min_response_time = min(response_times)
-            max_response_time = max(response_times)
+            # Sort once; min and max are then read off the ends
+            ok_times = np.sort(response_times[succeeded])
+            avg_response_time = float(ok_times.mean())
+            min_response_time = float(ok_times[0])
+            max_response_time = float(ok_times[-1])
             
-            if len(response_times) > 1:
-                std_dev_response_time = statistics.stdev(response_times)
-                percentile_90 = np.percentile(response_times, 90)
-                percentile_95 = np.percentile(response_times, 95)
-                percentile_99 = np.percentile(response_times, 99)
+            if ok_times.size > 1:
+                std_dev_response_time = float(ok_times.std(ddof=1))
+                
+                percentile_90, percentile_95, percentile_99 = np.quantile(
+                    ok_times, [0.90, 0.95, 0.99]
+                ).tolist()
             else:
                 std_dev_response_time = 0
-                percentile_90 = percentile_95 = percentile_99 = response_times[0]
+                percentile_90 = percentile_95 = percentile_99 = min_response_time
         else:
             avg_response_time = min_response_time = max_response_time = 0
             std_dev_response_time = percentile_90 = percentile_95 = percentile_99 = 0
         
         # Prepare summary results
         test_results = {
-            "url": f"{self.base_url}/{endpoint}".rstrip('/'),
+            "url": self._endpoint_url(endpoint),
             "method": method,
             "num_requests": num_requests,
             "successful_requests": successful_requests,
@@ -591,7 +780,11 @@ class LoadTester:
         headers = headers or {}
         data = data or {}
         
-        overall_start_time = time.time()
+        # Size the pool for the busiest step once, so every step reuses the
+        # connections opened by the ones before it
+        self._ensure_pool(max(start_concurrency, max_concurrency))
+        
+        overall_start_time = time.perf_counter_ns()
         step_results = []
         breaking_point = None
         
@@ -640,8 +833,8 @@ class LoadTester:
             # Small pause between steps to let the system recover
             time.sleep(2.0)
         
-        overall_end_time = time.time()
-        total_test_time = overall_end_time - overall_start_time
+        overall_end_time = time.perf_counter_ns()
+        total_test_time = (overall_end_time - overall_start_time) / 1e9
         
         # Calculate overall statistics
         all_success_rates = [r['success_rate'] for r in step_results]
@@ -662,7 +855,7 @@ class LoadTester:
         
         # Prepare summary results
         stress_test_results = {
-            "url": f"{self.base_url}/{endpoint}".rstrip('/'),
+            "url": self._endpoint_url(endpoint),
             "method": method,
             "start_concurrency": start_concurrency,
             "max_tested_concurrency": step_results[-1]['concurrency'],
@@ -692,7 +885,8 @@ class LoadTester:
         throughputs = [r['requests_per_second'] for r in results['detailed_step_results']]
         
         # Create figure with multiple subplots
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 15), sharex=True)
+        fig = Figure(figsize=(12, 15))
+        ax1, ax2, ax3 = fig.subplots(3, 1, sharex=True)
         
         # Plot success rate
         ax1.plot(concurrency_levels, success_rates, 'o-', color='green', label='Success Rate (%)')
@@ -726,9 +920,8 @@ class LoadTester:
             for ax in [ax1, ax2, ax3]:
                 ax.axvline(x=optimal, color='green', linestyle='--', alpha=0.7, label='Optimal Concurrency')
         
-        plt.tight_layout()
-        plt.savefig("stress_test_results.png")
-        plt.show()
+        fig.tight_layout()
+        fig.savefig("stress_test_results.png")
 
 
 # ===== SYSTEM RESOURCE MONITORING =====
@@ -736,27 +929,65 @@ class LoadTester:
 class ResourceMonitor:
     """Class for monitoring system resources during performance tests."""
     
-    def __init__(self, interval: float = 0.1):
+    # Series recorded per sample, in buffer row order
+    METRICS = (
+        'timestamps', 'cpu_percent', 'memory_percent', 'memory_used',
+        'disk_io_read', 'disk_io_write', 'network_sent', 'network_recv'
+    )
+    
+    # Samples the buffers hold before they first grow
+    INITIAL_CAPACITY = 1024
+    
+    def __init__(self, interval: float = 0.1, capacity: Optional[int] = None):
         """
         Initialize the resource monitor.
         
         Args:
             interval: Sampling interval in seconds
+            capacity: Maximum number of samples to keep. When set, the buffers
+                are allocated once and wrap around, keeping the most recent
+                samples; by default they grow to hold the whole run
         """
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
         self.interval = interval
+        self.capacity = capacity
         self.running = False
         self.monitor_thread = None
+        self._stop_event = threading.Event()
+        # Guards swapping the buffer and advancing the sample count, which
+        # the monitor thread and reset()/readers would otherwise interleave
+        self._lock = threading.Lock()
         self.start_time = None
-        self.data = {
-            'timestamps': [],
-            'cpu_percent': [],
-            'memory_percent': [],
-            'memory_used': [],
-            'disk_io_read': [],
-            'disk_io_write': [],
-            'network_sent': [],
-            'network_recv': []
-        }
+        self._start_ns = None
+        self._allocate()
+    
+    def _allocate(self):
+        """Allocate empty sample buffers: one row per metric, one column per sample."""
+        size = self.capacity or self.INITIAL_CAPACITY
+        self._buffer = np.empty((len(self.METRICS), size), dtype=np.float64)
+        self._count = 0
+    
+    def _samples(self) -> np.ndarray:
+        """Columns of the buffer holding samples, in storage (not time) order."""
+        with self._lock:
+            buffer, count = self._buffer, self._count
+        return buffer[:, :min(count, buffer.shape[1])]
+    
+    @property
+    def data(self) -> Dict[str, np.ndarray]:
+        """
+        Recorded samples per metric, in recording order.
+        
+        These are views into the buffers, except once a fixed-capacity
+        buffer has wrapped around, when they are reordered copies.
+        """
+        with self._lock:
+            buffer, count = self._buffer, self._count
+            samples = buffer[:, :min(count, buffer.shape[1])]
+            if count > samples.shape[1]:
+                samples = np.roll(samples, -(count % samples.shape[1]), axis=1)
+        return {name: samples[row] for row, name in enumerate(self.METRICS)}
     
     def _monitor_resources(self):
         """Background thread that collects resource usage data."""
@@ -768,15 +999,19 @@ class ResourceMonitor:
         last_net_sent = initial_net_io.bytes_sent if initial_net_io else 0
         last_net_recv = initial_net_io.bytes_recv if initial_net_io else 0
         
-        while self.running:
-            current_time = time.time() - self.start_time
+        # Counters that are unavailable at start stay so; don't poll them
+        has_disk_io = initial_disk_io is not None
+        has_net_io = initial_net_io is not None
+        
+        while not self._stop_event.is_set():
+            current_time = (time.perf_counter_ns() - self._start_ns) / 1e9
             
             # CPU and memory
             cpu = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             
             # Disk I/O
-            disk_io = psutil.disk_io_counters()
+            disk_io = psutil.disk_io_counters() if has_disk_io else None
             if disk_io:
                 disk_read = disk_io.read_bytes
                 disk_write = disk_io.write_bytes
@@ -788,7 +1023,7 @@ class ResourceMonitor:
                 read_rate = write_rate = 0
             
             # Network I/O
-            net_io = psutil.net_io_counters()
+            net_io = psutil.net_io_counters() if has_net_io else None
             if net_io:
                 net_sent = net_io.bytes_sent
                 net_recv = net_io.bytes_recv
@@ -799,24 +1034,37 @@ class ResourceMonitor:
             else:
                 sent_rate = recv_rate = 0
             
-            # Record data
-            self.data['timestamps'].append(current_time)
-            self.data['cpu_percent'].append(cpu)
-            self.data['memory_percent'].append(memory.percent)
-            self.data['memory_used'].append(memory.used / (1024 * 1024))  # Convert to MB
-            self.data['disk_io_read'].append(read_rate / (1024 * 1024))  # Convert to MB/s
-            self.data['disk_io_write'].append(write_rate / (1024 * 1024))  # Convert to MB/s
-            self.data['network_sent'].append(sent_rate / (1024 * 1024))  # Convert to MB/s
-            self.data['network_recv'].append(recv_rate / (1024 * 1024))  # Convert to MB/s
+            # Record data, doubling the buffers when they are full or, with a
+            # fixed capacity, overwriting the oldest sample
+            with self._lock:
+                idx = self._count
+                if idx == self._buffer.shape[1] and self.capacity is None:
+                    grown = np.empty((len(self.METRICS), 2 * idx), dtype=np.float64)
+                    grown[:, :idx] = self._buffer
+                    self._buffer = grown
+                
+                self._buffer[:, idx % self._buffer.shape[1]] = (
+                    current_time,
+                    cpu,
+                    memory.percent,
+                    memory.used / (1024 * 1024),  # Convert to MB
+                    read_rate / (1024 * 1024),  # Convert to MB/s
+                    write_rate / (1024 * 1024),  # Convert to MB/s
+                    sent_rate / (1024 * 1024),  # Convert to MB/s
+                    recv_rate / (1024 * 1024)  # Convert to MB/s
+                )
+                self._count = idx + 1
             
-            # Sleep for the specified interval
-            time.sleep(self.interval)
+            # Wait for the specified interval, waking at once when stopped
+            self._stop_event.wait(self.interval)
     
     def start(self):
         """Start monitoring resources."""
         if not self.running:
             self.running = True
+            self._stop_event.clear()
             self.start_time = time.time()
+            self._start_ns = time.perf_counter_ns()
             self.monitor_thread = threading.Thread(target=self._monitor_resources)
             self.monitor_thread.daemon = True
             self.monitor_thread.start()
@@ -828,6 +1076,7 @@ class ResourceMonitor:
         """Stop monitoring resources."""
         if self.running:
             self.running = False
+            self._stop_event.set()
             if self.monitor_thread:
                 self.monitor_thread.join(timeout=2 * self.interval)
             logger.info("Resource monitoring stopped")
@@ -842,16 +1091,18 @@ class ResourceMonitor:
             Dictionary with resource usage statistics
         """
         stats = {}
+        # Order does not matter here, so read the buffer in place even when
+        # it has wrapped around
+        samples = self._samples()
         
-        for key in ['cpu_percent', 'memory_percent', 'memory_used', 
-                    'disk_io_read', 'disk_io_write', 
-                    'network_sent', 'network_recv']:
-            if self.data[key]:
+        for row, key in enumerate(self.METRICS[1:], start=1):
+            values = samples[row]
+            if values.size:
                 stats[key] = {
-                    'min': min(self.data[key]),
-                    'max': max(self.data[key]),
-                    'avg': statistics.mean(self.data[key]),
-                    'std_dev': statistics.stdev(self.data[key]) if len(self.data[key]) > 1 else 0
+                    'min': float(values.min()),
+                    'max': float(values.max()),
+                    'avg': float(values.mean()),
+                    'std_dev': float(values.std(ddof=1)) if values.size > 1 else 0
                 }
             else:
                 stats[key] = {
@@ -870,57 +1121,50 @@ class ResourceMonitor:
         Args:
             title: Title for the plot
         """
-        if not self.data['timestamps']:
+        data = self.data
+        if not data['timestamps'].size:
             logger.warning("No monitoring data available to visualize")
             return
         
-        fig, (ax1, ax2, ax3, ax4) = plt.subplots(4, 1, figsize=(12, 16), sharex=True)
+        fig = Figure(figsize=(12, 16))
+        ax1, ax2, ax3, ax4 = fig.subplots(4, 1, sharex=True)
         
         # CPU and Memory
-        ax1.plot(self.data['timestamps'], self.data['cpu_percent'], label='CPU %', color='red')
-        ax1.plot(self.data['timestamps'], self.data['memory_percent'], label='Memory %', color='blue')
+        ax1.plot(data['timestamps'], data['cpu_percent'], label='CPU %', color='red')
+        ax1.plot(data['timestamps'], data['memory_percent'], label='Memory %', color='blue')
         ax1.set_ylabel('Percentage (%)')
         ax1.set_title(title)
         ax1.grid(True)
         ax1.legend()
         
         # Memory Used
-        ax2.plot(self.data['timestamps'], self.data['memory_used'], label='Memory Used (MB)', color='green')
+        ax2.plot(data['timestamps'], data['memory_used'], label='Memory Used (MB)', color='green')
         ax2.set_ylabel('Memory (MB)')
         ax2.grid(True)
         ax2.legend()
         
         # Disk I/O
-        ax3.plot(self.data['timestamps'], self.data['disk_io_read'], label='Disk Read (MB/s)', color='purple')
-        ax3.plot(self.data['timestamps'], self.data['disk_io_write'], label='Disk Write (MB/s)', color='orange')
+        ax3.plot(data['timestamps'], data['disk_io_read'], label='Disk Read (MB/s)', color='purple')
+        ax3.plot(data['timestamps'], data['disk_io_write'], label='Disk Write (MB/s)', color='orange')
         ax3.set_ylabel('Disk I/O (MB/s)')
         ax3.grid(True)
         ax3.legend()
         
         # Network I/O
-        ax4.plot(self.data['timestamps'], self.data['network_sent'], label='Network Sent (MB/s)', color='teal')
-        ax4.plot(self.data['timestamps'], self.data['network_recv'], label='Network Recv (MB/s)', color='brown')
+        ax4.plot(data['timestamps'], data['network_sent'], label='Network Sent (MB/s)', color='teal')
+        ax4.plot(data['timestamps'], data['network_recv'], label='Network Recv (MB/s)', color='brown')
         ax4.set_xlabel('Time (s)')
         ax4.set_ylabel('Network I/O (MB/s)')
         ax4.grid(True)
         ax4.legend()
         
-        plt.tight_layout()
-        plt.savefig(f"{title.replace(' ', '_')}.png")
-        plt.show()
+        fig.tight_layout()
+        fig.savefig(f"{title.replace(' ', '_')}.png")
     
     def reset(self):
         """Reset the collected data."""
-        self.data = {
-            'timestamps': [],
-            'cpu_percent': [],
-            'memory_percent': [],
-            'memory_used': [],
-            'disk_io_read': [],
-            'disk_io_write': [],
-            'network_sent': [],
-            'network_recv': []
-        }
+        with self._lock:
+            self._allocate()
         logger.info("Resource monitoring data reset")
 
 